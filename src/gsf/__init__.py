@@ -22,6 +22,7 @@
 # ******************************************************************************************************
 
 from enum import Enum
+from functools import lru_cache
 from decimal import Decimal
 from datetime import datetime
 from dateutil import parser
@@ -102,6 +103,8 @@ class ByteSize:
     FLOAT64 = 8
 
 
+# Cache is typed since IntEnum members of different enumerations can compare equal
+@lru_cache(maxsize=None, typed=True)
 def normalize_enumname(value: Enum) -> str:
     parts = str(value).split(".")
     return parts[1].capitalize() if len(parts) == 2 else str(value).capitalize()
@@ -41,13 +41,15 @@ class NativeEndian:
 
     @classmethod
     def _from_buffer(cls, buffer: bytes, bytesize: int, dtype: np.dtype) -> Union[int, float]:
-        if len(buffer) < bytesize:
-            raise ValueError(f"Buffer size too small, {bytesize} bytes required to convert bytes to {bytesize * 8}-bit type")
-
         if cls.swaporder:
             dtype = dtype.newbyteorder()
 
-        return np.frombuffer(buffer[:bytesize], dtype)[0]
+        # Reading a single element with an explicit count avoids both an up-front
+        # length check and slicing a copy of the buffer; short buffers raise here
+        try:
+            return np.frombuffer(buffer, dtype, 1)[0]
+        except ValueError as ex:
+            raise ValueError(f"Buffer size too small, {bytesize} bytes required to convert bytes to {bytesize * 8}-bit type") from ex
 
     @classmethod
     def _int_to_bytes(cls, bytesize: int, value: int, signed: bool) -> bytes:
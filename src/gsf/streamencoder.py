@@ -27,6 +27,13 @@ from typing import Callable, Optional
 import sys
 import numpy as np
 
+_INT16_DTYPE = np.dtype(np.int16)
+_UINT16_DTYPE = np.dtype(np.uint16)
+_INT32_DTYPE = np.dtype(np.int32)
+_UINT32_DTYPE = np.dtype(np.uint32)
+_INT64_DTYPE = np.dtype(np.int64)
+_UINT64_DTYPE = np.dtype(np.uint64)
+
 
 class StreamEncoder:
     """
@@ -39,6 +46,8 @@ class StreamEncoder:
 
     # Source C# reference: GSF.IO.StreamExtensions
 
+    RX_BUFFERSIZE = 64
+
     def __init__(self, read: Callable[[int], bytes], write: Callable[[bytes], int], default_byteorder: str = sys.byteorder):
         """
         Parameters
@@ -54,6 +63,8 @@ class StreamEncoder:
         self._write = write
         self._default_byteorder = default_byteorder
         self._default_is_native = self._default_byteorder == sys.byteorder
+        self._rxbuffer = bytearray(StreamEncoder.RX_BUFFERSIZE)
+        self._rxview = memoryview(self._rxbuffer)
 
     @property
     def default_byteorder(self) -> str:
@@ -70,11 +81,36 @@ class StreamEncoder:
         buffer = self._read(count)
         read_length = len(buffer)
 
-        for i in range(read_length):
-            target_buffer[offset + i] = buffer[i]
+        target_buffer[offset:offset + read_length] = buffer
 
         return read_length
 
+    def read_exact(self, count: int) -> memoryview:
+        """
+        Reads exactly `count` bytes from the base stream, retrying partial reads as needed.
+        Returned view references a reusable internal buffer and is only valid until the next read.
+        """
+        if count > len(self._rxbuffer):
+            self._rxbuffer = bytearray(max(count, len(self._rxbuffer) * 2))
+            self._rxview = memoryview(self._rxbuffer)
+
+        rxview = self._rxview
+        received = 0
+
+        while received < count:
+            remaining = count - received
+            buffer = self._read(remaining)
+            length = len(buffer)
+
+            # Reads that return no bytes, or more bytes than requested, would lose stream position
+            if length == 0 or length > remaining:
+                raise RuntimeError(f"Failed to read {count}-bytes from stream")
+
+            rxview[received:received + length] = buffer
+            received += length
+
+        return self._rxview[:count]
+
     def write_byte(self, value: np.uint8) -> int:
         size = ByteSize.UINT8
 
@@ -114,52 +150,46 @@ class StreamEncoder:
         return size
 
     def _read_int(self, size: int, dtype: np.dtype, byteorder: Optional[str]) -> int:
-        # call expects needed bytes to be available in base stream
-        buffer = self._read(size)
-
-        if len(buffer) != size:
-            raise RuntimeError(f"Failed to read {size}-bytes from stream")
-
         if not (byteorder is None and self._default_is_native) and byteorder != sys.byteorder:
             dtype = dtype.newbyteorder()
 
-        return np.frombuffer(buffer, dtype)[0]
+        return np.frombuffer(self.read_exact(size), dtype)[0]
 
     def write_int16(self, value: np.int16, byteorder: Optional[str] = None) -> int:
         return self._write_int(ByteSize.INT16, value, True, byteorder)
 
     def read_int16(self, byteorder: Optional[str] = None) -> np.int16:
-        return self._read_int(ByteSize.INT16, np.dtype(np.int16), byteorder)
+        return self._read_int(ByteSize.INT16, _INT16_DTYPE, byteorder)
 
     def write_uint16(self, value: np.uint16, byteorder: Optional[str] = None) -> int:
         return self._write_int(ByteSize.UINT16, value, False, byteorder)
 
     def read_uint16(self, byteorder: Optional[str] = None) -> np.uint16:
-        return self._read_int(ByteSize.UINT16, np.dtype(np.uint16), byteorder)
+        return self._read_int(ByteSize.UINT16, _UINT16_DTYPE, byteorder)
 
     def write_int32(self, value: np.int32, byteorder: Optional[str] = None) -> int:
         return self._write_int(ByteSize.INT32, value, True, byteorder)
 
     def read_int32(self, byteorder: Optional[str] = None) -> np.int32:
-        return self._read_int(ByteSize.INT32, np.dtype(np.int32), byteorder)
+        return self._read_int(ByteSize.INT32, _INT32_DTYPE, byteorder)
 
     def write_uint32(self, value: np.uint32, byteorder: Optional[str] = None) -> int:
         return self._write_int(ByteSize.UINT32, value, False, byteorder)
 
     def read_uint32(self, byteorder: Optional[str] = None) -> np.uint32:
-        return self._read_int(ByteSize.UINT32, np.dtype(np.uint32), byteorder)
+        return self._read_int(ByteSize.UINT32, _UINT32_DTYPE, byteorder)
 
     def write_int64(self, value: np.int64, byteorder: Optional[str] = None) -> int:
         return self._write_int(ByteSize.INT64, value, True, byteorder)
 
     def read_int64(self, byteorder: Optional[str] = None) -> np.int64:
-        return self._read_int(ByteSize.INT64, np.dtype(np.int64), byteorder)
+        return self._read_int(ByteSize.INT64, _INT64_DTYPE, byteorder)
 
     def write_uint64(self, value: np.uint64, byteorder: Optional[str] = None) -> int:
         return self._write_int(ByteSize.UINT64, value, False, byteorder)
 
     def read_uint64(self, byteorder: Optional[str] = None) -> np.uint64:
-        return self._read_int(ByteSize.UINT64, np.dtype(np.uint64), byteorder)
+        return self._read_int(ByteSize.UINT64, _UINT64_DTYPE, byteorder)
 
     def write7bit_uint32(self, value: np.uint32) -> int:
         return Encoding7Bit.WriteUInt32(self.write_byte, value)
@@ -24,7 +24,7 @@
 from gsf import normalize_enumname
 from .errors import EvaluateError
 from enum import IntEnum
-from typing import Optional, Tuple
+from typing import Final, Optional, Tuple
 
 
 class ExpressionType(IntEnum):
@@ -70,6 +70,9 @@ class ExpressionValueType(IntEnum):
     a filter expression. All data table column values will be mapped to these types.
     """
 
+    # Do not reorder: integer types must precede the other numeric types, which must precede all
+    # non-numeric types, so that `is_integertype` and `is_numerictype` reduce to range checks
+
     BOOLEAN = 0
     """
     Boolean value type for an expression, i.e., `bool`.
@@ -115,24 +118,44 @@ class ExpressionValueType(IntEnum):
     Undefined value type for an expression, i.e., `None`.
     """
 
-EXPRESSIONVALUETYPELEN = ExpressionValueType.UNDEFINED + 1
+EXPRESSIONVALUETYPELEN: Final[int] = len(ExpressionValueType)
 """
 Defines the number of elements in the `ExpressionValueType` enumeration.
 """
 
+# Module-level aliases of ExpressionValueType members, resolved as plain globals
+# rather than through the enum class attribute lookup on hot paths
+EVT_BOOLEAN = ExpressionValueType.BOOLEAN
+EVT_INT32 = ExpressionValueType.INT32
+EVT_INT64 = ExpressionValueType.INT64
+EVT_DECIMAL = ExpressionValueType.DECIMAL
+EVT_DOUBLE = ExpressionValueType.DOUBLE
+EVT_STRING = ExpressionValueType.STRING
+EVT_GUID = ExpressionValueType.GUID
+EVT_DATETIME = ExpressionValueType.DATETIME
+EVT_UNDEFINED = ExpressionValueType.UNDEFINED
+
+EXPRESSIONVALUETYPE_NAMES: Tuple[str, ...] = ("Boolean", "Int32", "Int64", "Decimal", "Double", "String", "Guid", "DateTime", "Undefined")
+"""
+Defines the display names of the `ExpressionValueType` members, indexed by value.
+"""
+
+assert EVT_BOOLEAN == 0 and EVT_INT32 == 1 and EVT_INT64 == 2 and EVT_DECIMAL == 3 and EVT_DOUBLE == 4, \
+    "ExpressionValueType integer and numeric types must be ordered first"
+
 def is_integertype(type: ExpressionValueType) -> bool:
     """
     Determines if the specified expression value type is an integer type.
     """
 
-    return type in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64]
+    return type <= EVT_INT64
 
 def is_numerictype(type: ExpressionValueType) -> bool:
     """
     Determines if the specified expression value type is a numeric type.
     """
 
-    return type in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64, ExpressionValueType.DECIMAL, ExpressionValueType.DOUBLE]
+    return type <= EVT_DOUBLE
 
 class ExpressionUnaryType(IntEnum):
     """
@@ -155,8 +178,15 @@ class ExpressionUnaryType(IntEnum):
     """
 
     def __str__(self):
-        return "+" if self.value == 0 else \
-               "-" if self.value == 1 else "~"
+        return _UNARYTYPE_SYMBOLS[self._value_]
+
+
+_UNARYTYPE_SYMBOLS = ("+", "-", "~")
+
+EXPRESSIONUNARYTYPE_NAMES: Tuple[str, ...] = tuple(normalize_enumname(unarytype) for unarytype in ExpressionUnaryType)
+"""
+Defines the display names of the `ExpressionUnaryType` members, indexed by value.
+"""
 
 
 class ExpressionFunctionType(IntEnum):
@@ -507,58 +537,19 @@ class ExpressionOperatorType(IntEnum):
     """
 
     def __str__(self):
-        if self.value == ExpressionOperatorType.MULTIPLY:
-            return "*"
-        if self.value == ExpressionOperatorType.DIVIDE:
-            return "/"
-        if self.value == ExpressionOperatorType.MODULUS:
-            return "%"
-        if self.value == ExpressionOperatorType.ADD:
-            return "+"
-        if self.value == ExpressionOperatorType.SUBTRACT:
-            return "-"
-        if self.value == ExpressionOperatorType.BITSHIFTLEFT:
-            return "<<"
-        if self.value == ExpressionOperatorType.BITSHIFTRIGHT:
-            return ">>"
-        if self.value == ExpressionOperatorType.BITWISEAND:
-            return "&"
-        if self.value == ExpressionOperatorType.BITWISEOR:
-            return "|"
-        if self.value == ExpressionOperatorType.BITWISEXOR:
-            return "^"
-        if self.value == ExpressionOperatorType.LESSTHAN:
-            return "<"
-        if self.value == ExpressionOperatorType.LESSTHANOREQUAL:
-            return "<="
-        if self.value == ExpressionOperatorType.GREATERTHAN:
-            return ">"
-        if self.value == ExpressionOperatorType.GREATERTHANOREQUAL:
-            return ">="
-        if self.value == ExpressionOperatorType.EQUAL:
-            return "="
-        if self.value == ExpressionOperatorType.EQUALEXACTMATCH:
-            return "==="
-        if self.value == ExpressionOperatorType.NOTEQUAL:
-            return "<>"
-        if self.value == ExpressionOperatorType.NOTEQUALEXACTMATCH:
-            return "!=="
-        if self.value == ExpressionOperatorType.ISNULL:
-            return "IS NULL"
-        if self.value == ExpressionOperatorType.ISNOTNULL:
-            return "IS NOT NULL"
-        if self.value == ExpressionOperatorType.LIKE:
-            return "LIKE"
-        if self.value == ExpressionOperatorType.LIKEEXACTMATCH:
-            return "LIKE BINARY"
-        if self.value == ExpressionOperatorType.NOTLIKE:
-            return "NOT LIKE"
-        if self.value == ExpressionOperatorType.NOTLIKEEXACTMATCH:
-            return "NOT LIKE BINARY"
-        if self.value == ExpressionOperatorType.AND:
-            return "AND"
-        if self.value == ExpressionOperatorType.OR:
-            return "OR"
+        return _OPERATORTYPE_SYMBOLS[self._value_]
+
+
+_OPERATORTYPE_SYMBOLS = (
+    "*", "/", "%", "+", "-", "<<", ">>", "&", "|", "^",
+    "<", "<=", ">", ">=", "=", "===", "<>", "!==",
+    "IS NULL", "IS NOT NULL", "LIKE", "LIKE BINARY", "NOT LIKE", "NOT LIKE BINARY",
+    "AND", "OR")
+
+EXPRESSIONOPERATORTYPE_NAMES: Tuple[str, ...] = tuple(normalize_enumname(operatortype) for operatortype in ExpressionOperatorType)
+"""
+Defines the display names of the `ExpressionOperatorType` members, indexed by value.
+"""
 
 
 class TimeInterval(IntEnum):
@@ -617,261 +608,179 @@ class TimeInterval(IntEnum):
 
     @classmethod
     def parse(cls, name: str) -> Optional["TimeInterval"]:
-        return getattr(cls, name.upper(), None)
+        interval = _TIMEINTERVAL_NAMES.get(name)
 
+        # Only normalize case when name is not already in a common casing
+        return _TIMEINTERVAL_NAMES.get(name.upper()) if interval is None else interval
 
-# Operation Value Type Selectors
 
+# Maps upper, lower and capitalized time interval names to their members
+_TIMEINTERVAL_NAMES = {
+    casedname: member
+    for name, member in TimeInterval.__members__.items()
+    for casedname in (name, name.lower(), name.capitalize())
+}
 
-# sourcery skip
-def derive_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
-    if operationtype in [
-            ExpressionOperatorType.MULTIPLY,
-            ExpressionOperatorType.DIVIDE,
-            ExpressionOperatorType.ADD,
-            ExpressionOperatorType.SUBTRACT]:
-        return derive_arithmetic_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
 
-    if operationtype in [
-            ExpressionOperatorType.MODULUS,
-            ExpressionOperatorType.BITWISEAND,
-            ExpressionOperatorType.BITWISEOR,
-            ExpressionOperatorType.BITWISEXOR]:
-        return derive_integer_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
+# Operation Value Type Selectors
 
-    if operationtype in [
-            ExpressionOperatorType.LESSTHAN,
-            ExpressionOperatorType.LESSTHANOREQUAL,
-            ExpressionOperatorType.GREATERTHAN,
-            ExpressionOperatorType.GREATERTHANOREQUAL,
-            ExpressionOperatorType.EQUAL,
-            ExpressionOperatorType.EQUALEXACTMATCH,
-            ExpressionOperatorType.NOTEQUAL,
-            ExpressionOperatorType.NOTEQUALEXACTMATCH]:
-        return derive_comparison_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
+_OPERATION_ERROR = "cannot perform \"%s\" operation on \"%s\" and \"%s\""
 
-    if operationtype in [
-            ExpressionOperatorType.AND,
-            ExpressionOperatorType.OR]:
-        return derive_boolean_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
 
-    return leftvaluetype, None
+class _OperationError(EvaluateError):
+    """
+    Invalid operation `EvaluateError` that defers formatting its message until it is displayed.
+    Operation and value types are the exception arguments, so the error can be pickled.
+    """
 
+    def __init__(self, operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType):
+        super().__init__(operationtype, leftvaluetype, rightvaluetype)
 
-# sourcery skip
-def derive_arithmetic_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
-    if leftvaluetype == ExpressionValueType.BOOLEAN:
-        return derive_arithmetic_operationvaluetype_fromboolean(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.INT32:
-        return derive_arithmetic_operationvaluetype_fromint32(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.INT64:
-        return derive_arithmetic_operationvaluetype_fromint64(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.DECIMAL:
-        return derive_arithmetic_operationvaluetype_fromdecimal(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.DOUBLE:
-        return derive_arithmetic_operationvaluetype_fromdouble(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.STRING and operationtype == ExpressionOperatorType.ADD:
-        return ExpressionValueType.STRING, None
-
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"{normalize_enumname(leftvaluetype)}\" and \"{normalize_enumname(rightvaluetype)}\"")
-
-
-def derive_arithmetic_operationvaluetype_fromboolean(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype == ExpressionValueType.BOOLEAN:
-        return ExpressionValueType.BOOLEAN, None
-    if rightvaluetype == ExpressionValueType.INT32:
-        return ExpressionValueType.INT32, None
-    if rightvaluetype == ExpressionValueType.INT64:
-        return ExpressionValueType.INT64, None
-    if rightvaluetype == ExpressionValueType.DECIMAL:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
-    if rightvaluetype == ExpressionValueType.STRING and operationtype == ExpressionOperatorType.ADD:
-        return ExpressionValueType.STRING, None
-
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Boolean\" and \"{normalize_enumname(rightvaluetype)}\"")
-
-
-def derive_arithmetic_operationvaluetype_fromint32(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32]:
-        return ExpressionValueType.INT32, None
-    if rightvaluetype == ExpressionValueType.INT64:
-        return ExpressionValueType.INT64, None
-    if rightvaluetype == ExpressionValueType.DECIMAL:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
-    if rightvaluetype == ExpressionValueType.STRING and operationtype == ExpressionOperatorType.ADD:
-        return ExpressionValueType.STRING, None
-
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Int32\" and \"{normalize_enumname(rightvaluetype)}\"")
-
-
-def derive_arithmetic_operationvaluetype_fromint64(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64]:
-        return ExpressionValueType.INT64, None
-    if rightvaluetype == ExpressionValueType.DECIMAL:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
-    if rightvaluetype == ExpressionValueType.STRING and operationtype == ExpressionOperatorType.ADD:
-        return ExpressionValueType.STRING, None
-
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Int64\" and \"{normalize_enumname(rightvaluetype)}\"")
-
-
-def derive_arithmetic_operationvaluetype_fromdecimal(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64, ExpressionValueType.DECIMAL]:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
-    if rightvaluetype == ExpressionValueType.STRING and operationtype == ExpressionOperatorType.ADD:
-        return ExpressionValueType.STRING, None
-
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Decimal\" and \"{normalize_enumname(rightvaluetype)}\"")
-
-
-def derive_arithmetic_operationvaluetype_fromdouble(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64, ExpressionValueType.DECIMAL, ExpressionValueType.DOUBLE]:
-        return ExpressionValueType.DOUBLE, None
-    if rightvaluetype == ExpressionValueType.STRING and operationtype == ExpressionOperatorType.ADD:
-        return ExpressionValueType.STRING, None
-
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Double\" and \"{normalize_enumname(rightvaluetype)}\"")
+    def __str__(self):
+        operationtype, leftvaluetype, rightvaluetype = self.args
+        return _OPERATION_ERROR % (EXPRESSIONOPERATORTYPE_NAMES[operationtype], EXPRESSIONVALUETYPE_NAMES[leftvaluetype], EXPRESSIONVALUETYPE_NAMES[rightvaluetype])
 
+    def __repr__(self):
+        return f"EvaluateError({str(self)!r})"
 
-# sourcery skip
-def derive_integer_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
-    if leftvaluetype == ExpressionValueType.BOOLEAN:
-        return derive_integer_operationvaluetype_fromboolean(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.INT32:
-        return derive_integer_operationvaluetype_fromint32(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.INT64:
-        return derive_integer_operationvaluetype_fromint64(operationtype, rightvaluetype)
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"{normalize_enumname(leftvaluetype)}\" and \"{normalize_enumname(rightvaluetype)}\"")
+def derive_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
+    """
+    Derives the resulting value type of the specified operation on the specified left and right value types.
+    Results are read from a lookup table precomputed at import, so a returned error is a shared instance
+    that should be reported, not raised.
+    """
 
+    return _OPERATIONVALUETYPES[(operationtype * EXPRESSIONVALUETYPELEN + leftvaluetype) * EXPRESSIONVALUETYPELEN + rightvaluetype]
 
-def derive_integer_operationvaluetype_fromboolean(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype == ExpressionValueType.BOOLEAN:
-        return ExpressionValueType.BOOLEAN, None
-    if rightvaluetype == ExpressionValueType.INT32:
-        return ExpressionValueType.INT32, None
-    if rightvaluetype == ExpressionValueType.INT64:
-        return ExpressionValueType.INT64, None
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Boolean\" and \"{normalize_enumname(rightvaluetype)}\"")
+_ARITHMETIC_OPERATORTYPES = frozenset({
+    ExpressionOperatorType.MULTIPLY,
+    ExpressionOperatorType.DIVIDE,
+    ExpressionOperatorType.ADD,
+    ExpressionOperatorType.SUBTRACT})
 
+_INTEGER_OPERATORTYPES = frozenset({
+    ExpressionOperatorType.MODULUS,
+    ExpressionOperatorType.BITWISEAND,
+    ExpressionOperatorType.BITWISEOR,
+    ExpressionOperatorType.BITWISEXOR})
 
-def derive_integer_operationvaluetype_fromint32(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32]:
-        return ExpressionValueType.INT32, None
-    if rightvaluetype == ExpressionValueType.INT64:
-        return ExpressionValueType.INT64, None
+_COMPARISON_OPERATORTYPES = frozenset({
+    ExpressionOperatorType.LESSTHAN,
+    ExpressionOperatorType.LESSTHANOREQUAL,
+    ExpressionOperatorType.GREATERTHAN,
+    ExpressionOperatorType.GREATERTHANOREQUAL,
+    ExpressionOperatorType.EQUAL,
+    ExpressionOperatorType.EQUALEXACTMATCH,
+    ExpressionOperatorType.NOTEQUAL,
+    ExpressionOperatorType.NOTEQUALEXACTMATCH})
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Int32\" and \"{normalize_enumname(rightvaluetype)}\"")
+_BOOLEAN_OPERATORTYPES = frozenset({
+    ExpressionOperatorType.AND,
+    ExpressionOperatorType.OR})
 
 
-def derive_integer_operationvaluetype_fromint64(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64]:
-        return ExpressionValueType.INT64, None
+# sourcery skip
+def _derive_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
+    if operationtype in _ARITHMETIC_OPERATORTYPES:
+        return derive_arithmetic_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Int64\" and \"{normalize_enumname(rightvaluetype)}\"")
+    if operationtype in _INTEGER_OPERATORTYPES:
+        return derive_integer_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
 
+    if operationtype in _COMPARISON_OPERATORTYPES:
+        return derive_comparison_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
 
-# sourcery skip
-def derive_comparison_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
-    if leftvaluetype == ExpressionValueType.BOOLEAN:
-        return derive_comparison_operationvaluetype_fromboolean(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.INT32:
-        return derive_comparison_operationvaluetype_fromint32(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.INT64:
-        return derive_comparison_operationvaluetype_fromint64(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.DECIMAL:
-        return derive_comparison_operationvaluetype_fromdecimal(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.DOUBLE:
-        return derive_comparison_operationvaluetype_fromdouble(operationtype, rightvaluetype)
-    if leftvaluetype == ExpressionValueType.STRING:
-        return leftvaluetype, None
-    if leftvaluetype == ExpressionValueType.GUID:
-        return derive_comparison_operationvaluetype_fromguid(operationtype, rightvaluetype)
+    if operationtype in _BOOLEAN_OPERATORTYPES:
+        return derive_boolean_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
+
+    return leftvaluetype, None
 
-    return derive_comparison_operationvaluetype_fromdatetime(operationtype, rightvaluetype)
 
+def derive_arithmetic_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
+    valuetype = _ARITHMETIC_VALUETYPES[leftvaluetype * EXPRESSIONVALUETYPELEN + rightvaluetype]
 
-def derive_comparison_operationvaluetype_fromboolean(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.STRING]:
-        return ExpressionValueType.BOOLEAN, None
-    if rightvaluetype == ExpressionValueType.INT32:
-        return ExpressionValueType.INT32, None
-    if rightvaluetype == ExpressionValueType.INT64:
-        return ExpressionValueType.INT64, None
-    if rightvaluetype == ExpressionValueType.DECIMAL:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
+    if valuetype != EVT_UNDEFINED:
+        return ExpressionValueType(valuetype), None
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Boolean\" and \"{normalize_enumname(rightvaluetype)}\"")
+    # String concatenation is allowed with a string left operand, or a numeric left operand and string right operand
+    if operationtype == ExpressionOperatorType.ADD and (leftvaluetype == EVT_STRING or (rightvaluetype == EVT_STRING and leftvaluetype <= EVT_DOUBLE)):
+        return EVT_STRING, None
 
+    return EVT_UNDEFINED, _OperationError(operationtype, leftvaluetype, rightvaluetype)
 
-def derive_comparison_operationvaluetype_fromint32(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32]:
-        return ExpressionValueType.INT32, None
-    if rightvaluetype == ExpressionValueType.INT64:
-        return ExpressionValueType.INT64, None
-    if rightvaluetype in [ExpressionValueType.STRING, ExpressionValueType.DECIMAL]:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Int32\" and \"{normalize_enumname(rightvaluetype)}\"")
+# Arithmetic on numeric types promotes to the wider of the two types, i.e., the greater value given the
+# ExpressionValueType ordering; table is indexed by `leftvaluetype * EXPRESSIONVALUETYPELEN + rightvaluetype`
+_ARITHMETIC_VALUETYPES = bytes(
+    max(leftvaluetype, rightvaluetype) if leftvaluetype <= EVT_DOUBLE and rightvaluetype <= EVT_DOUBLE else EVT_UNDEFINED
+    for leftvaluetype in range(EXPRESSIONVALUETYPELEN)
+    for rightvaluetype in range(EXPRESSIONVALUETYPELEN))
 
 
-def derive_comparison_operationvaluetype_fromint64(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64]:
-        return ExpressionValueType.INT64, None
-    if rightvaluetype in [ExpressionValueType.STRING, ExpressionValueType.DECIMAL]:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
+def derive_integer_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
+    # Integer types promote to the wider of the two types, i.e., the greater value given the ExpressionValueType ordering
+    if leftvaluetype <= EVT_INT64 and rightvaluetype <= EVT_INT64:
+        return ExpressionValueType(max(leftvaluetype, rightvaluetype)), None
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Int64\" and \"{normalize_enumname(rightvaluetype)}\"")
+    return EVT_UNDEFINED, _OperationError(operationtype, leftvaluetype, rightvaluetype)
 
 
-def derive_comparison_operationvaluetype_fromdecimal(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64, ExpressionValueType.DECIMAL, ExpressionValueType.STRING]:
-        return ExpressionValueType.DECIMAL, None
-    if rightvaluetype == ExpressionValueType.DOUBLE:
-        return ExpressionValueType.DOUBLE, None
+def derive_comparison_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
+    valuetype = _COMPARISON_VALUETYPES[leftvaluetype * EXPRESSIONVALUETYPELEN + rightvaluetype]
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Decimal\" and \"{normalize_enumname(rightvaluetype)}\"")
+    if valuetype != EVT_UNDEFINED:
+        return ExpressionValueType(valuetype), None
 
+    return EVT_UNDEFINED, _OperationError(operationtype, leftvaluetype, rightvaluetype)
 
-def derive_comparison_operationvaluetype_fromdouble(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.BOOLEAN, ExpressionValueType.INT32, ExpressionValueType.INT64, ExpressionValueType.DECIMAL, ExpressionValueType.DOUBLE, ExpressionValueType.STRING]:
-        return ExpressionValueType.DOUBLE, None
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Double\" and \"{normalize_enumname(rightvaluetype)}\"")
+def _build_comparison_valuetypes() -> bytes:
+    table = bytearray([EVT_UNDEFINED]) * (EXPRESSIONVALUETYPELEN * EXPRESSIONVALUETYPELEN)
 
+    for leftvaluetype in range(EXPRESSIONVALUETYPELEN):
+        row = leftvaluetype * EXPRESSIONVALUETYPELEN
 
-def derive_comparison_operationvaluetype_fromguid(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.GUID, ExpressionValueType.STRING]:
-        return ExpressionValueType.GUID, None
+        if leftvaluetype <= EVT_DOUBLE:
+            # Numeric types compare as the wider of the two types
+            for rightvaluetype in range(EVT_DOUBLE + 1):
+                table[row + rightvaluetype] = max(leftvaluetype, rightvaluetype)
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"Guid\" and \"{normalize_enumname(rightvaluetype)}\"")
+            # Strings are parsed as the left type, with integers widened to decimal
+            table[row + EVT_STRING] = leftvaluetype if leftvaluetype in (EVT_BOOLEAN, EVT_DOUBLE) else EVT_DECIMAL
+        elif leftvaluetype == EVT_STRING:
+            for rightvaluetype in range(EXPRESSIONVALUETYPELEN):
+                table[row + rightvaluetype] = EVT_STRING
+        elif leftvaluetype == EVT_GUID:
+            table[row + EVT_GUID] = table[row + EVT_STRING] = EVT_GUID
+        else:
+            # Undefined, i.e., null, left operands follow date/time comparison rules
+            table[row + EVT_DATETIME] = table[row + EVT_STRING] = EVT_DATETIME
 
+    return bytes(table)
 
-def derive_comparison_operationvaluetype_fromdatetime(operationtype: ExpressionOperatorType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:  # sourcery skip
-    if rightvaluetype in [ExpressionValueType.DATETIME, ExpressionValueType.STRING]:
-        return ExpressionValueType.DATETIME, None
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"DateTime\" and \"{normalize_enumname(rightvaluetype)}\"")
+# Comparison operand value types, indexed by `leftvaluetype * EXPRESSIONVALUETYPELEN + rightvaluetype`
+_COMPARISON_VALUETYPES = _build_comparison_valuetypes()
 
 
 # sourcery skip
 def derive_boolean_operationvaluetype(operationtype: ExpressionOperatorType, leftvaluetype: ExpressionValueType, rightvaluetype: ExpressionValueType) -> Tuple[ExpressionValueType, Optional[Exception]]:
-    if leftvaluetype == ExpressionValueType.BOOLEAN and rightvaluetype == ExpressionValueType.BOOLEAN:
-        return ExpressionValueType.BOOLEAN, None
+    if leftvaluetype == EVT_BOOLEAN and rightvaluetype == EVT_BOOLEAN:
+        return EVT_BOOLEAN, None
+
+    return EVT_UNDEFINED, _OperationError(operationtype, leftvaluetype, rightvaluetype)
+
+
+def _build_operationvaluetypes() -> Tuple[Tuple[ExpressionValueType, Optional[Exception]], ...]:
+    return tuple(
+        _derive_operationvaluetype(operationtype, leftvaluetype, rightvaluetype)
+        for operationtype in ExpressionOperatorType
+        for leftvaluetype in ExpressionValueType
+        for rightvaluetype in ExpressionValueType)
+
 
-    return ExpressionValueType.UNDEFINED, EvaluateError(f"cannot perform \"{normalize_enumname(operationtype)}\" operation on \"{normalize_enumname(leftvaluetype)}\" and \"{normalize_enumname(rightvaluetype)}\"")
+# Operation value types and errors, flattened and indexed by
+# `(operationtype * EXPRESSIONVALUETYPELEN + leftvaluetype) * EXPRESSIONVALUETYPELEN + rightvaluetype`
+_OPERATIONVALUETYPES = _build_operationvaluetypes()
@@ -22,12 +22,13 @@
 # ******************************************************************************************************
 
 from __future__ import annotations
-from gsf import Empty, normalize_enumname
-from .datatype import DataType
-from typing import TYPE_CHECKING
+from gsf import Empty
+from .datatype import DataType, DATATYPE_NAMES
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .datatable import DataTable
+    from .expressiontree import ExpressionTree
 
 
 class DataColumn:
@@ -37,6 +38,8 @@ class DataColumn:
     functions (https://sttp.github.io/documentation/filter-expressions/) defined in an expression.
     """
 
+    __slots__ = ("_parent", "_name", "_datatype", "_expression", "_computed", "_index", "_repr", "_expressiontree")
+
     def __init__(self,
                  parent: DataTable,
                  name: str,
@@ -51,8 +54,16 @@ class DataColumn:
         self._name = name
         self._datatype = datatype
         self._expression = Empty.STRING if expression is ... or expression is None else expression
-        self._computed = len(self._expression) > 0
+        self._computed = bool(self._expression)
         self._index = -1
+        self._expressiontree: Optional[ExpressionTree] = None
+
+        datatypename = DATATYPE_NAMES[datatype]
+
+        if self._computed:
+            datatypename = f"Computed {datatypename}"
+
+        self._repr = f"{name} ({datatypename})"
 
     @property
     def parent(self) -> DataTable:
@@ -104,9 +115,4 @@ class DataColumn:
         return self._index
 
     def __repr__(self):
-        datatype = normalize_enumname(self._datatype)
-
-        if self._computed:
-            datatype = f"Computed {datatype}"
-
-        return f"{self._name} ({datatype})"
+        return self._repr
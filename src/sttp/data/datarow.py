@@ -22,22 +22,71 @@
 # ******************************************************************************************************
 
 from __future__ import annotations
-from gsf import Convert, Empty, normalize_enumname
-from .datatype import DataType, default_datatype
+from gsf import Convert, Empty
+from .datatype import DataType, DATATYPE_NAMES, default_datatype
 from .datacolumn import DataColumn
-from .constants import ExpressionValueType
 from .errors import EvaluateError
 from decimal import Decimal
 from datetime import datetime
 from uuid import UUID
-from typing import Callable, Iterator, Optional, Tuple, Union, TYPE_CHECKING
+from functools import partial
+from copy import copy
+from operator import methodcaller
+from typing import Callable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 import numpy as np
 
 if TYPE_CHECKING:
-    from .dataset import xsdformat
     from .datatable import DataTable
     from .expressiontree import ExpressionTree
 
+_DATATYPELEN = len(DataType)
+
+# Default values for each column data type, indexed by `DataType`
+_DEFAULT_VALUES: Tuple[object, ...] = tuple(default_datatype(datatype) for datatype in DataType)
+
+# String value converters for each column data type, indexed by `DataType`
+_FROMSTRING_CONVERTERS: Tuple[Callable[[str], object], ...] = (
+    str,                                          # STRING
+    bool,                                         # BOOLEAN
+    partial(Convert.from_str, dtype=datetime),    # DATETIME
+    partial(Convert.from_str, dtype=np.float32),  # SINGLE
+    partial(Convert.from_str, dtype=np.float64),  # DOUBLE
+    Decimal,                                      # DECIMAL
+    UUID,                                         # GUID
+    partial(Convert.from_str, dtype=np.int8),     # INT8
+    partial(Convert.from_str, dtype=np.int16),    # INT16
+    partial(Convert.from_str, dtype=np.int32),    # INT32
+    partial(Convert.from_str, dtype=np.int64),    # INT64
+    partial(Convert.from_str, dtype=np.uint8),    # UINT8
+    partial(Convert.from_str, dtype=np.uint16),   # UINT16
+    partial(Convert.from_str, dtype=np.uint32),   # UINT32
+    partial(Convert.from_str, dtype=np.uint64))   # UINT64
+
+# Numeric value converters for each column data type, indexed by `DataType`,
+# `None` where the column data type cannot be converted from a numeric value
+_FROMVALUE_CONVERTERS: Tuple[Optional[Callable[[object], object]], ...] = (
+    str,                                          # STRING
+    lambda value: value != 0,                     # BOOLEAN
+    None,                                         # DATETIME
+    np.float32,                                   # SINGLE
+    np.float64,                                   # DOUBLE
+    Decimal,                                      # DECIMAL
+    None,                                         # GUID
+    np.int8,                                      # INT8
+    np.int16,                                     # INT16
+    np.int32,                                     # INT32
+    np.int64,                                     # INT64
+    np.uint8,                                     # UINT8
+    np.uint16,                                    # UINT16
+    np.uint32,                                    # UINT32
+    np.uint64)                                    # UINT64
+
+
+# Results of `DataRow._checkstate`, as (invalid, result) pairs
+_INVALID_STATE = (True, Empty.STRING)
+_NULL_STATE = (True, "<NULL>")
+_VALID_STATE = (False, Empty.STRING)
+
 
 class DataRow:
     """
@@ -45,6 +94,8 @@ class DataRow:
     defined `DataColumn` field in the `DataTable` columns collection.
     """
 
+    __slots__ = ("_parent", "_values")
+
     def __init__(self,
                  parent: DataTable,
                  ):
@@ -53,7 +104,7 @@ class DataRow:
         """
 
         self._parent = parent
-        self._values = np.empty(parent.columncount, object)
+        self._values: List[object] = [None] * parent.columncount
 
     def __getitem__(self, key: Union[int, str]) -> object:
         if isinstance(key, str):
@@ -93,16 +144,19 @@ class DataRow:
         return self._parent
 
     def _get_columnindex(self, columnname: str) -> Tuple[int, Optional[Exception]]:
-        if (column := self._parent.column_byname(columnname)) is None:
+        # Read name to index map of parent table directly, lookups are case-insensitive
+        if (columnindex := self._parent._columnindexes.get(columnname.upper())) is None:
             return -1, ValueError(f"column name \"{columnname}\" was not found in table \"{self._parent.name}\"")
 
-        return column.index, None
+        return columnindex, None
 
     def _validate_columntype(self, columnindex: int, targettype: Union[int, DataType], read: bool) -> Tuple[Optional[DataColumn], Optional[Exception]]:
         if (column := self._parent.column(columnindex)) is None:
             return None, IndexError(f"column index {columnindex} is out of range for table \"{self._parent.name}\"")
 
-        if targettype > -1 and column.datatype != targettype:
+        datatype = column._datatype
+
+        if targettype > -1 and datatype != targettype:
             if read:
                 action = "read"
                 preposition = "from"
@@ -110,18 +164,23 @@ class DataRow:
                 action = "assign"
                 preposition = "to"
 
-            return None, ValueError(f"cannot {action} \"{normalize_enumname(DataType(targettype))}\" value {preposition} DataColumn \"{column.name}\" for table \"{self._parent.name}\", column data type is \"{normalize_enumname(column.datatype)}\"")
-
-        if not read and column.computed:
-            return None, ValueError(f"cannot assign value to DataColumn \"{column.name}\" for table \"{self._parent.name}\", column is computed with an expression")
+            return None, ValueError(f"cannot {action} \"{DATATYPE_NAMES[targettype]}\" value {preposition} DataColumn \"{column.name}\" for table \"{self._parent.name}\", column data type is \"{DATATYPE_NAMES[datatype]}\"")
 
         return column, None
 
+    def _column_byname(self, columnname: str) -> Tuple[Optional[DataColumn], Optional[Exception]]:
+        columnindex, err = self._get_columnindex(columnname)
+
+        if err is not None:
+            return None, err
+
+        return self._parent.column(columnindex), None
+
     def _expressiontree(self, column: DataColumn) -> Tuple[Optional[ExpressionTree], Optional[Exception]]:
-        columnindex = column.index
-        value = self._values[columnindex]
+        # Parsed expression tree is cached on the column so it is shared by all rows
+        expressiontree = column._expressiontree
 
-        if value is None:
+        if expressiontree is None:
             from .filterexpressionparser import FilterExpressionParser
 
             expressiontree, err = FilterExpressionParser.generate_expressiontree(column.parent, column.expression, True)
@@ -129,10 +188,9 @@ class DataRow:
             if err is not None:
                 return None, EvaluateError(f"failed to parse expression \"{column.expression}\" defined for computed DataColumn \"{column.name}\" for table \"{self._parent.name}\": {err}")
 
-            self._values[columnindex] = expressiontree
-            return expressiontree, None
+            column._expressiontree = expressiontree
 
-        return value, None
+        return expressiontree, None
 
     def _get_computedvalue(self, column: DataColumn) -> Tuple[Optional[object], Optional[Exception]]:
         expressiontree, err = self._expressiontree(column)
@@ -141,7 +199,9 @@ class DataRow:
             return None, err
 
         try:
-            sourcevalue, err = expressiontree.evaluate(self)
+            # Evaluate a shallow copy of the cached tree: parsed expressions are shared, but the current
+            # row assigned by `evaluate` stays local to this call, so rows can be evaluated concurrently
+            sourcevalue, err = copy(expressiontree).evaluate(self)
         except Exception as ex:
             err = ex
 
@@ -149,63 +209,22 @@ class DataRow:
             return None, EvaluateError(f"failed to evaluate expression \"{column.expression}\" defined for computed DataColumn \"{column.name}\" for table \"{self._parent.name}\": {err}")
 
         sourcetype = sourcevalue.valuetype
-        targettype = column.datatype
-
-        if sourcetype == ExpressionValueType.BOOLEAN:
-            return self._convert_frombool(sourcevalue._booleanvalue(), targettype)
-        if sourcetype == ExpressionValueType.INT32:
-            return self._convert_fromint32(sourcevalue._int32value(), targettype)
-        if sourcetype == ExpressionValueType.INT64:
-            return self._convert_fromint64(sourcevalue._int64value(), targettype)
-        if sourcetype == ExpressionValueType.DECIMAL:
-            return self._convert_fromdecimal(sourcevalue._decimalvalue(), targettype)
-        if sourcetype == ExpressionValueType.DOUBLE:
-            return self._convert_fromdouble(sourcevalue._doublevalue(), targettype)
-        if sourcetype == ExpressionValueType.STRING:
-            return self._convert_fromstring(sourcevalue._stringvalue(), targettype)
-        if sourcetype == ExpressionValueType.GUID:
-            return self._convert_fromguid(sourcevalue._guidvalue(), targettype)
-        if sourcetype == ExpressionValueType.DATETIME:
-            return self._convert_fromdatetime(sourcevalue._datetimevalue(), targettype)
-
-        return None, TypeError("unexpected expression value type encountered")
+        targettype = column._datatype
 
-    def _convert_fromstring(self, value: str, targettype: DataType) -> Tuple[Optional[object], Optional[Exception]]:
-        try:
-            if targettype == DataType.STRING:
-                return value, None
-            if targettype == DataType.BOOLEAN:
-                return bool(value), None
-            if targettype == DataType.DATETIME:
-                return Convert.from_str(value, datetime)
-            if targettype == DataType.GUID:
-                return UUID(value), None
-            if targettype == DataType.SINGLE:
-                return Convert.from_str(value, np.float32), None
-            if targettype == DataType.DOUBLE:
-                return Convert.from_str(value, np.float64), None
-            if targettype == DataType.DECIMAL:
-                return Decimal(value), None
-            if targettype == DataType.INT8:
-                return Convert.from_str(value, np.int8), None
-            if targettype == DataType.INT16:
-                return Convert.from_str(value, np.int16), None
-            if targettype == DataType.INT32:
-                return Convert.from_str(value, np.int32), None
-            if targettype == DataType.INT64:
-                return Convert.from_str(value, np.int64), None
-            if targettype == DataType.UINT8:
-                return Convert.from_str(value, np.uint8), None
-            if targettype == DataType.UINT16:
-                return Convert.from_str(value, np.uint16), None
-            if targettype == DataType.UINT32:
-                return Convert.from_str(value, np.uint32), None
-            if targettype == DataType.UINT64:
-                return Convert.from_str(value, np.uint64), None
+        if sourcetype >= len(_COMPUTEDVALUE_CONVERTERS):
+            return None, TypeError("unexpected expression value type encountered")
 
+        getvalue, convert = _COMPUTEDVALUE_CONVERTERS[sourcetype]
+        return convert(self, getvalue(sourcevalue), targettype)
+
+    def _convert_fromstring(self, value: str, targettype: DataType) -> Tuple[Optional[object], Optional[Exception]]:
+        if targettype >= _DATATYPELEN:
             return None, TypeError("unexpected column data type encountered")
+
+        try:
+            return _FROMSTRING_CONVERTERS[targettype](value), None
         except Exception as ex:
-            return None, ValueError(f"failed to convert \"String\" expression value to \"{normalize_enumname(targettype)}\" column: {ex}")
+            return None, ValueError(f"failed to convert \"String\" expression value to \"{DATATYPE_NAMES[targettype]}\" column: {ex}")
 
     def _convert_fromguid(self, value: UUID, targettype: DataType) -> Tuple[Optional[object], Optional[Exception]]:
         try:
@@ -217,46 +236,23 @@ class DataRow:
                               DataType.DOUBLE, DataType.DECIMAL, DataType.INT8, DataType.INT16,
                               DataType.INT32, DataType.INT64, DataType.UINT8, DataType.UINT16,
                               DataType.UINT32, DataType.UINT64]:
-                return None, ValueError(f'cannot convert \"Guid\" expression value to \"{normalize_enumname(targettype)}\" column')
+                return None, ValueError(f'cannot convert \"Guid\" expression value to \"{DATATYPE_NAMES[targettype]}\" column')
 
             return None, TypeError("unexpected column data type encountered")
         except Exception as ex:
-            return None, ValueError(f'failed to convert \"Guid\" expression value to \"{normalize_enumname(targettype)}\" column: {ex}')
+            return None, ValueError(f'failed to convert \"Guid\" expression value to \"{DATATYPE_NAMES[targettype]}\" column: {ex}')
 
     def _convert_fromvalue(self, value: object, sourcetype: DataType, targettype: DataType) -> Tuple[Optional[object], Optional[Exception]]:
-        try:
-            if targettype == DataType.STRING:
-                return str(value), None
-            if targettype == DataType.BOOLEAN:
-                return value != 0, None
-            if targettype == DataType.SINGLE:
-                return np.float32(value), None
-            if targettype == DataType.DOUBLE:
-                return np.float64(value), None
-            if targettype == DataType.DECIMAL:
-                return Decimal(value), None
-            if targettype == DataType.INT8:
-                return np.int8(value), None
-            if targettype == DataType.INT16:
-                return np.int16(value), None
-            if targettype == DataType.INT32:
-                return np.int32(value), None
-            if targettype == DataType.INT64:
-                return np.int64(value), None
-            if targettype == DataType.UINT8:
-                return np.uint8(value), None
-            if targettype == DataType.UINT16:
-                return np.uint16(value), None
-            if targettype == DataType.UINT32:
-                return np.uint32(value), None
-            if targettype == DataType.UINT64:
-                return np.uint64(value), None
-            if targettype in [DataType.DATETIME, DataType.GUID]:
-                return None, ValueError(f"cannot convert \"{normalize_enumname(sourcetype)}\" expression value to \"{normalize_enumname(targettype)}\" column")
-
+        if targettype >= _DATATYPELEN:
             return None, TypeError("unexpected column data type encountered")
+
+        if (converter := _FROMVALUE_CONVERTERS[targettype]) is None:
+            return None, ValueError(f"cannot convert \"{DATATYPE_NAMES[sourcetype]}\" expression value to \"{DATATYPE_NAMES[targettype]}\" column")
+
+        try:
+            return converter(value), None
         except Exception as ex:
-            return None, ValueError(f"failed to convert \"{normalize_enumname(sourcetype)}\" expression value to \"{normalize_enumname(targettype)}\" column: {ex}")
+            return None, ValueError(f"failed to convert \"{DATATYPE_NAMES[sourcetype]}\" expression value to \"{DATATYPE_NAMES[targettype]}\" column: {ex}")
 
     def _convert_frombool(self, value: bool, targettype: DataType) -> Tuple[Optional[object], Optional[Exception]]:
         return self._convert_fromvalue(1 if value else 0, DataType.BOOLEAN, targettype)
@@ -276,11 +272,12 @@ class DataRow:
     def _convert_fromdatetime(self, value: datetime, targettype: DataType) -> Tuple[Optional[object], Optional[Exception]]:
         try:
             if targettype == DataType.STRING:
+                from .dataset import xsdformat
                 return xsdformat(value), None
             if targettype == DataType.DATETIME:
                 return value, None
         except Exception as ex:
-            return None, ValueError(f"failed to convert \"DateTime\" expression value to \"{normalize_enumname(targettype)}\" column: {ex}")
+            return None, ValueError(f"failed to convert \"DateTime\" expression value to \"{DATATYPE_NAMES[targettype]}\" column: {ex}")
 
         return self._convert_fromvalue(int(value.timestamp()), DataType.DATETIME, targettype)
 
@@ -290,44 +287,44 @@ class DataRow:
         """
 
         column, err = self._validate_columntype(columnindex, -1, True)
-
-        if err is not None:
-            return None, err
-
-        if column.computed:
-            return self._get_computedvalue(column)
-
-        return self._values[columnindex], None
+        return (None, err) if err is not None else self._columnvalue(column)
 
     def value_byname(self, columnname: str) -> Tuple[Optional[object], Optional[Exception]]:
         """
         Reads the record value for the specified column name.
         """
 
-        index, err = self._get_columnindex(columnname)
-        return (None, err) if err is not None else (self._values[index], None)
+        column, err = self._column_byname(columnname)
+        return (None, err) if err is not None else self._columnvalue(column)
+
+    def _columnvalue(self, column: DataColumn) -> Tuple[Optional[object], Optional[Exception]]:
+        if column._computed:
+            return self._get_computedvalue(column)
+
+        return self._values[column._index], None
 
     def set_value(self, columnindex: int, value: object) -> Optional[Exception]:
-        # sourcery skip: assign-if-exp
         """
         Assigns the record value at the specified column index.
         """
 
-        _, err = self._validate_columntype(columnindex, -1, False)
-
-        if err is not None:
-            return err
-
-        self._values[columnindex] = value
-        return None
+        column, err = self._validate_columntype(columnindex, -1, False)
+        return err if err is not None else self._set_columnvalue(column, value)
 
     def set_value_byname(self, columnname: str, value: object) -> Optional[Exception]:
         """
         Assigns the record value for the specified column name.
         """
 
-        index, err = self._get_columnindex(columnname)
-        return err if err is not None else self.set_value(index, value)
+        column, err = self._column_byname(columnname)
+        return err if err is not None else self._set_columnvalue(column, value)
+
+    def _set_columnvalue(self, column: DataColumn, value: object) -> Optional[Exception]:
+        if column._computed:
+            return ValueError(f"cannot assign value to DataColumn \"{column.name}\" for table \"{self._parent.name}\", column is computed with an expression")
+
+        self._values[column._index] = value
+        return None
 
     def value_as_string(self, columnindex: int) -> str:
         """
@@ -354,78 +351,52 @@ class DataRow:
         if column is None:
             return Empty.STRING
 
-        index = column.index
-        datatype = column.datatype
+        datatype = column._datatype
+        value, null, err = self._typevalue(column._index, datatype)
+        invalid, result = self._checkstate(null, err)
+
+        if invalid:
+            return result
 
-        if datatype == DataType.STRING:
-            return self._string_from_typevalue(index, self.stringvalue)
-        if datatype == DataType.BOOLEAN:
-            return self._string_from_typevalue(index, self.booleanvalue)
         if datatype == DataType.DATETIME:
-            return self._string_from_typevalue(index, self.datetimevalue, xsdformat)
-        if datatype == DataType.SINGLE:
-            return self._string_from_typevalue(index, self.singlevalue)
-        if datatype == DataType.DOUBLE:
-            return self._string_from_typevalue(index, self.doublevalue)
-        if datatype == DataType.DECIMAL:
-            return self._string_from_typevalue(index, self.decimalvalue)
-        if datatype == DataType.GUID:
-            return self._string_from_typevalue(index, self.guidvalue)
-        if datatype == DataType.INT8:
-            return self._string_from_typevalue(index, self.int8value)
-        if datatype == DataType.INT16:
-            return self._string_from_typevalue(index, self.int16value)
-        if datatype == DataType.INT32:
-            return self._string_from_typevalue(index, self.int32value)
-        if datatype == DataType.INT64:
-            return self._string_from_typevalue(index, self.int64value)
-        if datatype == DataType.UINT8:
-            return self._string_from_typevalue(index, self.uint8value)
-        if datatype == DataType.UINT16:
-            return self._string_from_typevalue(index, self.uint16value)
-        if datatype == DataType.UINT32:
-            return self._string_from_typevalue(index, self.uint32value)
-        if datatype == DataType.UINT64:
-            return self._string_from_typevalue(index, self.uint64value)
-
-        return Empty.STRING
+            from .dataset import xsdformat
+            return xsdformat(value)
+
+        return str(value)
 
     def _checkstate(self, null: bool, err: Optional[Exception]) -> Tuple[bool, str]:
         if err is not None:
-            return True, Empty.STRING
-
-        return (True, "<NULL>") if null else (False, Empty.STRING)
+            return _INVALID_STATE
 
-    def _string_from_typevalue(self, index: int, getvalue: Callable[[int], Tuple[object, bool, Optional[Exception]]], strconv: Callable[[object], str] = str) -> str:
-        value, null, err = getvalue(index)
-        invalid, result = self._checkstate(null, err)
-        
-        return result if invalid else strconv(value)
+        return _NULL_STATE if null else _VALID_STATE
 
     def _typevalue(self, columnindex: int, targettype: DataType) -> Tuple[object, bool, Optional[Exception]]:
-        column, err = self._validate_columntype(columnindex, targettype, True)
-        default = default_datatype(targettype)
+        columns = self._parent._columns
 
-        if err is not None:
-            return default, False, err
-
-        if column.computed:
-            value, err = self._get_computedvalue(column)
+        # Only validate, for error, when column index is out of range or column type does not match
+        if 0 <= columnindex < len(columns) and columns[columnindex]._datatype == targettype:
+            column = columns[columnindex]
+        else:
+            column, err = self._validate_columntype(columnindex, targettype, True)
 
             if err is not None:
-                return default, False, err
+                return _DEFAULT_VALUES[targettype], False, err
 
-            return (default, True, None) if value is None else (value, False, None)
+        if column._computed:
+            value, err = self._get_computedvalue(column)
 
-        value = self._values[columnindex]
+            if err is not None:
+                return _DEFAULT_VALUES[targettype], False, err
+        else:
+            value = self._values[columnindex]
 
-        return (default, True, None) if value is None else (value, False, None)
+        return (_DEFAULT_VALUES[targettype], True, None) if value is None else (value, False, None)
 
     def _typevalue_byname(self, columnname: str, targettype: DataType) -> Tuple[object, bool, Optional[Exception]]:
         index, err = self._get_columnindex(columnname)
 
         if err is not None:
-            return default_datatype(targettype), False, err
+            return _DEFAULT_VALUES[targettype], False, err
 
         return self._typevalue(index, targettype)
 
@@ -700,25 +671,10 @@ class DataRow:
         return self._typevalue_byname(columnname, DataType.UINT64)
 
     def __repr__(self):
-        image = ["["]
-
-        for i in range(self._parent.columncount):
-            if i > 0:
-                image.append(", ")
-
-            strcol = self._parent.column(i).datatype == DataType.STRING
+        values = [f"\"{self.columnvalue_as_string(column)}\"" if column._datatype == DataType.STRING else self.columnvalue_as_string(column)
+                  for column in self._parent._columns]
 
-            if strcol:
-                image.append("\"")
-
-            image.append(self.value_as_string(i))
-
-            if strcol:
-                image.append("\"")
-
-        image.append("]")
-
-        return "".join(image)
+        return f"[{', '.join(values)}]"
 
     @staticmethod
     def compare_datarowcolumns(leftrow: DataRow, rightrow: DataRow, columnindex: int, exactmatch: bool) -> Tuple[int, Optional[Exception]]:  # sourcery skip: low-code-quality
@@ -728,102 +684,67 @@ class DataRow:
         An error will br returned if column index is out of range of either row, or row types do not match.
         """
 
-        leftcolumn = leftrow.parent.column(columnindex)
-        rightcolumn = rightrow.parent.column(columnindex)
+        leftparent = leftrow._parent
+        leftcolumn = rightcolumn = leftparent.column(columnindex)
 
-        if leftcolumn is None or rightcolumn is None:
+        if leftcolumn is None:
             return 0, IndexError("cannot compare, column index out of range")
 
-        lefttype = leftcolumn.datatype
-        righttype = rightcolumn.datatype
+        datatype = leftcolumn._datatype
 
-        if lefttype != righttype:
-            return 0, ValueError("cannot compare, types do not match")
+        # Rows of the same table share column types, so only rows from different tables need a type check
+        if rightrow._parent is not leftparent:
+            if (rightcolumn := rightrow._parent.column(columnindex)) is None:
+                return 0, IndexError("cannot compare, column index out of range")
 
-        def nullcompare(lefthasvalue: bool, righthasvalue: bool) -> int:
-            if not lefthasvalue and not righthasvalue:
-                return 0, None
+            if datatype != rightcolumn._datatype:
+                return 0, ValueError("cannot compare, types do not match")
 
-            return 1 if lefthasvalue else -1, None
+        if datatype >= _DATATYPELEN:
+            return 0, TypeError("unexpected column data type encountered")
 
-        def typecompare(
-                leftrow_getvalue: Callable[[int], Tuple[object, bool, Optional[Exception]]],
-                rightrow_getvalue: Callable[[int], Tuple[object, bool, Optional[Exception]]]) -> \
-                            Tuple[int, Optional[Exception]]:
+        # Column types are already validated, so raw values are read without typed getter checks
+        leftvalue, lefterr = leftrow._columnvalue(leftcolumn)
+        rightvalue, righterr = rightrow._columnvalue(rightcolumn)
 
-            leftvalue, leftnull, lefterr = leftrow_getvalue(columnindex)
-            rightvalue, rightnull, righterr = rightrow_getvalue(columnindex)
+        lefthasvalue = leftvalue is not None and lefterr is None
+        righthasvalue = rightvalue is not None and righterr is None
 
-            lefthasvalue = not leftnull and lefterr is None
-            righthasvalue = not rightnull and righterr is None
+        if not lefthasvalue or not righthasvalue:
+            return _nullcompare(lefthasvalue, righthasvalue)
 
-            if lefthasvalue and righthasvalue:
-                if leftvalue < rightvalue:
-                    return -1, None
+        # Identical values, e.g., repeated strings shared across rows, are equal without comparing contents
+        if leftvalue is rightvalue:
+            return 0, None
 
-                return (1, None) if leftvalue > rightvalue else (0, None)
+        # Boolean values order True before False
+        if datatype == DataType.BOOLEAN:
+            return bool(rightvalue) - bool(leftvalue), None
 
-            return nullcompare(lefthasvalue, righthasvalue)
+        if datatype == DataType.STRING and exactmatch:
+            leftvalue = leftvalue.upper()
+            rightvalue = rightvalue.upper()
 
-        if lefttype == DataType.STRING:
-            if exactmatch:
-                def upperstringvalue(index: int, getvalue: Callable[[int], Tuple[object, bool, Optional[Exception]]]) -> Tuple[str, bool, Optional[Exception]]:
-                    value, null, err = getvalue(index)
+        if leftvalue < rightvalue:
+            return -1, None
 
-                    if not null and err is None:
-                        return value.upper(), False, None
+        return (1, None) if leftvalue > rightvalue else (0, None)
 
-                    return value, null, err
 
-                def leftrowvalue(index):
-                    return upperstringvalue(index, leftrow.stringvalue)
+def _nullcompare(lefthasvalue: bool, righthasvalue: bool) -> Tuple[int, Optional[Exception]]:
+    if not lefthasvalue and not righthasvalue:
+        return 0, None
 
-                def rightrowvalue(index):
-                    return upperstringvalue(index, rightrow.stringvalue)
-            else:
-                leftrowvalue = leftrow.stringvalue
-                rightrowvalue = rightrow.stringvalue
-
-            return typecompare(leftrowvalue, rightrowvalue)
-        if lefttype == DataType.BOOLEAN:
-            leftvalue, leftnull, lefterr = leftrow.booleanvalue(columnindex)
-            rightvalue, rightnull, righterr = rightrow.booleanvalue(columnindex)
-
-            lefthasvalue = not leftnull and lefterr is None
-            righthasvalue = not rightnull and righterr is None
-
-            if lefthasvalue and righthasvalue:
-                if leftvalue and not rightvalue:
-                    return -1, None
-
-                return (1, None) if not leftvalue and rightvalue else (0, None)
-
-            return nullcompare(lefthasvalue, righthasvalue)
-        if lefttype == DataType.DATETIME:
-            return typecompare(leftrow.datetimevalue, rightrow.datetimevalue)
-        if lefttype == DataType.SINGLE:
-            return typecompare(leftrow.singlevalue, rightrow.singlevalue)
-        if lefttype == DataType.DOUBLE:
-            return typecompare(leftrow.doublevalue, rightrow.doublevalue)
-        if lefttype == DataType.DECIMAL:
-            return typecompare(leftrow.decimalvalue, rightrow.decimalvalue)
-        if lefttype == DataType.GUID:
-            return typecompare(leftrow.guidvalue, rightrow.guidvalue)
-        if lefttype == DataType.INT8:
-            return typecompare(leftrow.int8value, rightrow.int8value)
-        if lefttype == DataType.INT16:
-            return typecompare(leftrow.int16value, rightrow.int16value)
-        if lefttype == DataType.INT32:
-            return typecompare(leftrow.int32value, rightrow.int32value)
-        if lefttype == DataType.INT64:
-            return typecompare(leftrow.int64value, rightrow.int64value)
-        if lefttype == DataType.UINT8:
-            return typecompare(leftrow.uint8value, rightrow.uint8value)
-        if lefttype == DataType.UINT16:
-            return typecompare(leftrow.uint16value, rightrow.uint16value)
-        if lefttype == DataType.UINT32:
-            return typecompare(leftrow.uint32value, rightrow.uint32value)
-        if lefttype == DataType.UINT64:
-            return typecompare(leftrow.uint64value, rightrow.uint64value)
-
-        return 0, TypeError("unexpected column data type encountered")
+    return 1 if lefthasvalue else -1, None
+
+
+# Computed value readers and converters, indexed by `ExpressionValueType`
+_COMPUTEDVALUE_CONVERTERS: Tuple[Tuple[Callable, Callable], ...] = (
+    (methodcaller("_booleanvalue"), DataRow._convert_frombool),         # BOOLEAN
+    (methodcaller("_int32value"), DataRow._convert_fromint32),          # INT32
+    (methodcaller("_int64value"), DataRow._convert_fromint64),          # INT64
+    (methodcaller("_decimalvalue"), DataRow._convert_fromdecimal),      # DECIMAL
+    (methodcaller("_doublevalue"), DataRow._convert_fromdouble),        # DOUBLE
+    (methodcaller("_stringvalue"), DataRow._convert_fromstring),        # STRING
+    (methodcaller("_guidvalue"), DataRow._convert_fromguid),            # GUID
+    (methodcaller("_datetimevalue"), DataRow._convert_fromdatetime))    # DATETIME
@@ -25,12 +25,31 @@ from __future__ import annotations
 from gsf import Empty
 from .datacolumn import DataColumn
 from .datarow import DataRow
-from .datatype import DataType
+from .datatype import DataType, default_datatype
 from typing import Callable, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
 
 if TYPE_CHECKING:
     from .dataset import DataSet
 
+# NumPy array data types for column values, indexed by `DataType`
+_COLUMN_DTYPES: Tuple[type, ...] = (
+    object,      # STRING
+    np.bool_,    # BOOLEAN
+    object,      # DATETIME
+    np.float32,  # SINGLE
+    np.float64,  # DOUBLE
+    object,      # DECIMAL
+    object,      # GUID
+    np.int8,     # INT8
+    np.int16,    # INT16
+    np.int32,    # INT32
+    np.int64,    # INT64
+    np.uint8,    # UINT8
+    np.uint16,   # UINT16
+    np.uint32,   # UINT32
+    np.uint64)   # UINT64
+
 class DataTable:
     """
     Represents a collection of `DataColumn` objects where each data column defines a name and a data
@@ -112,7 +131,7 @@ class DataTable:
         otherwise, None is returned.
         """
 
-        if columnindex < 0 or columnindex > len(self._columns):
+        if columnindex < 0 or columnindex >= len(self._columns):
             return None
 
         return self._columns[columnindex]
@@ -134,10 +153,7 @@ class DataTable:
         otherwise, -1 is returned. Lookup is case-insensitive.
         """
 
-        if (column := self.column_byname(columnname)) is not None:
-            return column.index
-
-        return -1
+        return self._columnindexes.get(columnname.upper(), -1)
 
     def create_column(self, name: str, datatype: DataType, expression: str = Empty.STRING):
         """
@@ -182,7 +198,7 @@ class DataTable:
         otherwise, None is returned.
         """
 
-        if rowindex < 0 or rowindex > len(self._rows):
+        if rowindex < 0 or rowindex >= len(self._rows):
             return None
 
         return self._rows[rowindex]
@@ -238,6 +254,68 @@ class DataTable:
 
         return len(self._rows)
 
+    def column_values(self, columnindex: int) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[Exception]]:
+        """
+        Gets the values of all rows at the specified column index as a NumPy array, typed to match
+        the column `DataType` for numeric and boolean columns, along with a boolean array that is
+        `True` where the row value is None; null values are set to the `DataType` default value.
+        Arrays are a snapshot of the row values, later row updates are not reflected. An error will be
+        returned if the column index is out of range or a row value cannot be stored in the typed array.
+        """
+
+        if (column := self.column(columnindex)) is None:
+            return None, None, IndexError(f"column index {columnindex} is out of range for table \"{self._name}\"")
+
+        datatype = column.datatype
+        default = default_datatype(datatype)
+        values = np.empty(len(self._rows), _COLUMN_DTYPES[datatype])
+        nulls = np.zeros(len(self._rows), np.bool_)
+
+        for i, row in enumerate(self._rows):
+            if row is None:
+                value = None
+            else:
+                value, err = row.value(columnindex)
+
+                if err is not None:
+                    return None, None, err
+
+            if value is None:
+                nulls[i] = True
+                value = default
+
+            try:
+                values[i] = value
+            except Exception as ex:
+                return None, None, ValueError(f"failed to read row {i} \"{column.name}\" column value as \"{_COLUMN_DTYPES[datatype].__name__}\" for table \"{self._name}\": {ex}")
+
+        return values, nulls, None
+
+    def argsort_column(self, columnindex: int, exactmatch: bool = False) -> Tuple[Optional[np.ndarray], Optional[Exception]]:
+        """
+        Gets the row indices that would sort the `DataTable` rows by the values at the specified column index,
+        using a stable sort that matches the ordering of `DataRow.compare_datarowcolumns`, i.e., null values
+        sort first and, for `DataType.BOOLEAN` columns, `True` sorts before `False`. When `exactmatch` is
+        `True`, `DataType.STRING` columns are compared case-insensitively; the parameter keeps the name and
+        meaning of `DataRow.compare_datarowcolumns`, which receives it from an "ORDER BY" term with the
+        `BINARY` or `===` modifier, so both methods produce the same order for the same arguments.
+        """
+
+        values, nulls, err = self.column_values(columnindex)
+
+        if err is not None:
+            return None, err
+
+        datatype = self._columns[columnindex].datatype
+
+        if datatype == DataType.BOOLEAN:
+            values = ~values
+        elif datatype == DataType.STRING and exactmatch:
+            values = np.array([value.upper() for value in values], object)
+
+        order = np.argsort(values, kind="stable")
+        return order[np.argsort(~nulls[order], kind="stable")], None
+
     def rowvalue_as_string(self, rowindex: int, columnindex: int) -> str:
         """
         Reads the row record value at the specified column index converted to a string.
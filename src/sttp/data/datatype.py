@@ -107,6 +107,13 @@ class DataType(IntEnum):
     """
 
 
+DATATYPE_NAMES: Tuple[str, ...] = ("String", "Boolean", "DateTime", "Single", "Double", "Decimal", "Guid",
+                                   "Int8", "Int16", "Int32", "Int64", "UInt8", "UInt16", "UInt32", "UInt64")
+"""
+Defines the display names of the `DataType` members, indexed by value.
+"""
+
+
 def default_datatype(datatype: DataType) -> object:  # sourcery skip: assign-if-exp, reintroduce-else
     if datatype == DataType.STRING:
         return Empty.STRING
@@ -21,10 +21,10 @@
 #
 # ******************************************************************************************************
 
-from gsf import Empty, Limits, normalize_enumname
+from gsf import Empty, Limits
 from .datarow import DataRow
 from .datatable import DataTable
-from .datatype import DataType
+from .datatype import DataType, DATATYPE_NAMES
 from .orderbyterm import OrderByTerm
 from .expression import Expression
 from .valueexpression import ValueExpression, \
@@ -42,10 +42,12 @@ from .constants import ExpressionType, \
     is_integertype, is_numerictype, \
     derive_operationvaluetype, \
     derive_comparison_operationvaluetype, \
-    derive_arithmetic_operationvaluetype
+    derive_arithmetic_operationvaluetype, \
+    EXPRESSIONVALUETYPE_NAMES, \
+    EXPRESSIONOPERATORTYPE_NAMES, \
+    EXPRESSIONUNARYTYPE_NAMES
 from .errors import EvaluateError
 from typing import Callable, List, Optional, Tuple, Union
-from functools import cmp_to_key
 from datetime import datetime, timezone
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
@@ -59,6 +61,27 @@ INTSIZE = 64 if sys.maxsize > 2**32 else 32
 
 UMAXINT64 = np.uint64(Limits.MAXINT64)
 
+# Expression value types and value converters used to evaluate column values, indexed by `DataType`
+_COLUMNVALUE_TYPES: Tuple[Tuple[ExpressionValueType, Optional[Callable[[object], object]]], ...] = (
+    (ExpressionValueType.STRING, None),         # STRING
+    (ExpressionValueType.BOOLEAN, None),        # BOOLEAN
+    (ExpressionValueType.DATETIME, None),       # DATETIME
+    (ExpressionValueType.DOUBLE, np.float64),   # SINGLE
+    (ExpressionValueType.DOUBLE, None),         # DOUBLE
+    (ExpressionValueType.DECIMAL, None),        # DECIMAL
+    (ExpressionValueType.GUID, None),           # GUID
+    (ExpressionValueType.INT32, np.int32),      # INT8
+    (ExpressionValueType.INT32, np.int32),      # INT16
+    (ExpressionValueType.INT32, None),          # INT32
+    (ExpressionValueType.INT64, None),          # INT64
+    (ExpressionValueType.INT32, np.int32),      # UINT8
+    (ExpressionValueType.INT32, np.int32),      # UINT16
+    (ExpressionValueType.INT64, np.int64),      # UINT32
+    (ExpressionValueType.INT64, np.int64))      # UINT64
+
+# Value types accepted as date/time function arguments
+_DATETIME_VALUETYPES = frozenset({ExpressionValueType.DATETIME, ExpressionValueType.STRING})
+
 
 def _find_nthindex(source: str, test: str, index: int) -> int:
     result = 0
@@ -136,7 +159,7 @@ class ExpressionTree:
         def predicate(result_expression: ValueExpression) -> Tuple[bool, Optional[Exception]]:
             # Final expression should have a boolean data type (operates as a WHERE clause)
             if result_expression.valuetype != ExpressionValueType.BOOLEAN:
-                return False, EvaluateError(f"cannot execute select operation, final expression tree evaluation result must be a boolean value, not \"{normalize_enumname(result_expression.valuetype)}\"")
+                return False, EvaluateError(f"cannot execute select operation, final expression tree evaluation result must be a boolean value, not \"{EXPRESSIONVALUETYPE_NAMES[result_expression.valuetype]}\"")
 
             # If final result is Null, i.e., has no value due to Null propagation, treat result as False
             return result_expression._booleanvalue(), None
@@ -181,27 +204,32 @@ class ExpressionTree:
 
         # Sort matching rows if requested
         if applysort and matchedrows and self.orderbyterms:
-            def compare_rows(leftmatchedrow: DataRow, rightmatchedrow: DataRow) -> int:
-                for orderbyterm in self.orderbyterms:
-                    if orderbyterm.ascending:
-                        leftrow = leftmatchedrow
-                        rightrow = rightmatchedrow
-                    else:
-                        leftrow = rightmatchedrow
-                        rightrow = leftmatchedrow
+            # Sort keys are read once per row, so computed column evaluations and exact match upper-casing
+            # are not repeated for every row comparison. Stable sorts applied from the last order-by term to
+            # the first produce the same ordering as comparing rows term by term.
+            for orderbyterm in reversed(self.orderbyterms):
+                column = table.column(orderbyterm.column.index)
+
+                if column is None:
+                    return [], EvaluateError("cannot execute select operation, failed while comparing rows for sorting: column index out of range")
 
-                    result, err = DataRow.compare_datarowcolumns(leftrow, rightrow, orderbyterm.column.index, orderbyterm.extactmatch)
+                datatype = column.datatype
+                upper = datatype == DataType.STRING and orderbyterm.extactmatch
 
-                    if err is not None:
-                        raise EvaluateError(f"cannot execute select operation, failed while comparing rows for sorting: {err}")
+                def sortkey(row: DataRow) -> Tuple[bool, object]:
+                    value, err = row._columnvalue(column)
 
-                    # If last compare result was equal, continue sort based on next order-by term
-                    if result != 0:
-                        return result
+                    # Null values order before non-null values
+                    if value is None or err is not None:
+                        return False, None
 
-                return 0
+                    # Boolean values order True before False
+                    if datatype == DataType.BOOLEAN:
+                        return True, not value
 
-            matchedrows.sort(key=cmp_to_key(compare_rows))
+                    return True, value.upper() if upper else value
+
+                matchedrows.sort(key=sortkey, reverse=not orderbyterm.ascending)
 
         return matchedrows, None
 
@@ -264,7 +292,7 @@ class ExpressionTree:
         if unary_valuetype == ExpressionValueType.DOUBLE:
             return unary_expression.applyto_double(unary_value._doublevalue())
 
-        return None, EvaluateError(f"cannot apply unary \"{normalize_enumname(unary_expression.unarytype)}\" operator to \"{normalize_enumname(unary_valuetype)}\"")
+        return None, EvaluateError(f"cannot apply unary \"{EXPRESSIONUNARYTYPE_NAMES[unary_expression.unarytype]}\" operator to \"{EXPRESSIONVALUETYPE_NAMES[unary_valuetype]}\"")
 
     def _evaluate_column(self, column_expression: ColumnExpression) -> Tuple[Optional[ValueExpression], Optional[Exception]]:  # sourcery skip
         if self._currentrow is None:
@@ -275,76 +303,26 @@ class ExpressionTree:
         if column is None:
             return None, TypeError("cannot evaluate column expression, data column reference is not defined")
 
-        columnindex = column.index
-        columndatatype = column.datatype
-
-        if columndatatype == DataType.STRING:
-            valuetype = ExpressionValueType.STRING
-            value, isnull, err = self._currentrow.stringvalue(columnindex)
-        elif columndatatype == DataType.BOOLEAN:
-            valuetype = ExpressionValueType.BOOLEAN
-            value, isnull, err = self._currentrow.booleanvalue(columnindex)
-        elif columndatatype == DataType.DATETIME:
-            valuetype = ExpressionValueType.DATETIME
-            value, isnull, err = self._currentrow.datetimevalue(columnindex)
-        elif columndatatype == DataType.SINGLE:
-            valuetype = ExpressionValueType.DOUBLE
-            f32, isnull, err = self._currentrow.singlevalue(columnindex)
-            value = np.float64(f32)
-        elif columndatatype == DataType.DOUBLE:
-            valuetype = ExpressionValueType.DOUBLE
-            value, isnull, err = self._currentrow.doublevalue(columnindex)
-        elif columndatatype == DataType.DECIMAL:
-            valuetype = ExpressionValueType.DECIMAL
-            value, isnull, err = self._currentrow.decimalvalue(columnindex)
-        elif columndatatype == DataType.GUID:
-            valuetype = ExpressionValueType.GUID
-            value, isnull, err = self._currentrow.guidvalue(columnindex)
-        elif columndatatype == DataType.INT8:
-            valuetype = ExpressionValueType.INT32
-            i8, isnull, err = self._currentrow.int8value(columnindex)
-            value = np.int32(i8)
-        elif columndatatype == DataType.INT16:
-            valuetype = ExpressionValueType.INT32
-            i16, isnull, err = self._currentrow.int16value(columnindex)
-            value = np.int32(i16)
-        elif columndatatype == DataType.INT32:
-            valuetype = ExpressionValueType.INT32
-            value, isnull, err = self._currentrow.int32value(columnindex)
-        elif columndatatype == DataType.INT64:
-            valuetype = ExpressionValueType.INT64
-            value, isnull, err = self._currentrow.int64value(columnindex)
-        elif columndatatype == DataType.UINT8:
-            valuetype = ExpressionValueType.INT32
-            ui8, isnull, err = self._currentrow.uint8value(columnindex)
-            value = np.int32(ui8)
-        elif columndatatype == DataType.UINT16:
-            valuetype = ExpressionValueType.INT32
-            ui16, isnull, err = self._currentrow.uint16value(columnindex)
-            value = np.int32(ui16)
-        elif columndatatype == DataType.UINT32:
-            valuetype = ExpressionValueType.INT64
-            ui32, isnull, err = self._currentrow.uint32value(columnindex)
-            value = np.int64(ui32)
-        elif columndatatype == DataType.UINT64:
-            ui64, isnull, err = self._currentrow.uint64value(columnindex)
-
-            if ui64 > UMAXINT64:
-                valuetype = ExpressionValueType.DOUBLE
-                value = np.float64(ui64)
-            else:
-                valuetype = ExpressionValueType.INT64
-                value = np.int64(ui64)
-        else:
+        columnindex = column._index
+        columndatatype = column._datatype
+
+        if columndatatype >= len(_COLUMNVALUE_TYPES):
             return None, TypeError("unexpected column data type encountered")
 
+        value, isnull, err = self._currentrow._typevalue(columnindex, columndatatype)
+        valuetype, convert = _COLUMNVALUE_TYPES[columndatatype]
+
         if err is not None:
-            return None, EvaluateError(f"failed while evaluating \"{column.name}\" column \"{normalize_enumname(columndatatype)}\" value for current row: {err}")
+            return None, EvaluateError(f"failed while evaluating \"{column.name}\" column \"{DATATYPE_NAMES[columndatatype]}\" value for current row: {err}")
 
         if isnull:
             return ValueExpression.nullvalue(valuetype), None
 
-        return ValueExpression(valuetype, value), None
+        # Unsigned 64-bit values that do not fit in a signed 64-bit integer are evaluated as doubles
+        if columndatatype == DataType.UINT64 and value > UMAXINT64:
+            valuetype, convert = ExpressionValueType.DOUBLE, np.float64
+
+        return ValueExpression(valuetype, value if convert is None else convert(value)), None
 
     def _evaluate_in_list(self, inlist_expression: InListExpression) -> Tuple[Optional[ValueExpression], Optional[Exception]]:
         inlist_value, err = self._evaluate(inlist_expression.value)
@@ -1112,17 +1090,17 @@ class ExpressionTree:
         leftvalue, err = self._evaluate(operator_expression.leftvalue)
 
         if err is not None:
-            return None, EvaluateError(f"failed while evaluating \"{normalize_enumname(operatortype)}\" operator left operand: {err}")
+            return None, EvaluateError(f"failed while evaluating \"{EXPRESSIONOPERATORTYPE_NAMES[operatortype]}\" operator left operand: {err}")
 
         rightvalue, err = self._evaluate(operator_expression.rightvalue)
 
         if err is not None:
-            return None, EvaluateError(f"failed while evaluating \"{normalize_enumname(operatortype)}\" operator right operand: {err}")
+            return None, EvaluateError(f"failed while evaluating \"{EXPRESSIONOPERATORTYPE_NAMES[operatortype]}\" operator right operand: {err}")
 
         valuetype, err = derive_operationvaluetype(operatortype, leftvalue.valuetype, rightvalue.valuetype)
 
         if err is not None:
-            return None, EvaluateError(f"failed while deriving \"{normalize_enumname(operatortype)}\" operator value type: {err}")
+            return None, EvaluateError(f"failed while deriving \"{EXPRESSIONOPERATORTYPE_NAMES[operatortype]}\" operator value type: {err}")
 
         if operatortype == ExpressionOperatorType.MULTIPLY:
             return self._multiply_op(leftvalue, rightvalue, valuetype)
@@ -1313,7 +1291,7 @@ class ExpressionTree:
         return ValueExpression(ExpressionValueType.BOOLEAN, testvalue._stringvalue() in sourcevalue._stringvalue()), None
 
     def _dateadd(self, sourcevalue: ValueExpression, addvalue: ValueExpression, intervaltype: ValueExpression) -> Tuple[Optional[ValueExpression], Optional[Exception]]:
-        if sourcevalue.valuetype not in [ExpressionValueType.DATETIME, ExpressionValueType.STRING]:
+        if sourcevalue.valuetype not in _DATETIME_VALUETYPES:
             return None, TypeError("\"DateAdd\" function source value, first argument, must be a \"DateTime\" or a \"String\"")
 
         if not is_integertype(addvalue.valuetype):
@@ -1368,10 +1346,10 @@ class ExpressionTree:
 
     def _datediff(self, leftvalue: ValueExpression, rightvalue: ValueExpression, intervaltype: ValueExpression) -> Tuple[Optional[ValueExpression], Optional[Exception]]:
         # sourcery skip
-        if leftvalue.valuetype not in [ExpressionValueType.DATETIME, ExpressionValueType.STRING]:
+        if leftvalue.valuetype not in _DATETIME_VALUETYPES:
             return None, TypeError("\"DateDiff\" function left value, first argument, must be a \"DateTime\" or a \"String\"")
 
-        if rightvalue.valuetype not in [ExpressionValueType.DATETIME, ExpressionValueType.STRING]:
+        if rightvalue.valuetype not in _DATETIME_VALUETYPES:
             return None, TypeError("\"DateDiff\" function right value, second argument, must be a \"DateTime\" or a \"String\"")
 
         if intervaltype.valuetype != ExpressionValueType.STRING:
@@ -1426,7 +1404,7 @@ class ExpressionTree:
         return None, TypeError("unexpected time interval encountered")
 
     def _datepart(self, sourcevalue: ValueExpression, intervaltype: ValueExpression) -> Tuple[Optional[ValueExpression], Optional[Exception]]:
-        if sourcevalue.valuetype not in [ExpressionValueType.DATETIME, ExpressionValueType.STRING]:
+        if sourcevalue.valuetype not in _DATETIME_VALUETYPES:
             return None, TypeError("\"DatePart\" function source value, first argument, must be a \"DateTime\" or a \"String\"")
 
         if intervaltype.valuetype != ExpressionValueType.STRING:
@@ -21,10 +21,10 @@
 #
 # ******************************************************************************************************
 
-from gsf import override, normalize_enumname
+from gsf import override
 from .expression import Expression
 from .valueexpression import ValueExpression
-from .constants import ExpressionType, ExpressionUnaryType, ExpressionValueType
+from .constants import ExpressionType, ExpressionUnaryType, ExpressionValueType, EXPRESSIONUNARYTYPE_NAMES
 from .errors import EvaluateError
 from decimal import Decimal
 from typing import Optional, Tuple
@@ -72,7 +72,7 @@ class UnaryExpression(Expression):
         if self._unarytype == ExpressionUnaryType.NOT:
             return ValueExpression(ExpressionValueType.BOOLEAN, not value), None
 
-        return None, EvaluateError(f"cannot apply unary type \"{normalize_enumname(self._unarytype)}\" to \"Boolean\" value")
+        return None, EvaluateError(f"cannot apply unary type \"{EXPRESSIONUNARYTYPE_NAMES[self._unarytype]}\" to \"Boolean\" value")
 
     def applyto_int32(self, value: np.int32) -> Tuple[Optional[ValueExpression], Optional[Exception]]:
         """
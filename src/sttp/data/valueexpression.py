@@ -25,12 +25,15 @@ from typing import Optional, Tuple, Union
 from gsf import Convert, Empty, override, normalize_enumname
 from .expression import Expression
 from .dataset import xsdformat
-from .constants import ExpressionType, ExpressionValueType
+from .constants import ExpressionType, ExpressionValueType, EXPRESSIONVALUETYPE_NAMES
 from decimal import Decimal
 from datetime import datetime
 from uuid import UUID
 import numpy as np
 
+# Value types stored as given, without conversion
+_UNCONVERTED_VALUETYPES = frozenset({ExpressionValueType.STRING, ExpressionValueType.GUID, ExpressionValueType.DATETIME})
+
 
 class ValueExpression(Expression):
     """
@@ -52,7 +55,7 @@ class ValueExpression(Expression):
             self._value = Decimal(value)
         elif valuetype == ExpressionValueType.DOUBLE:
             self._value = np.float64(value)
-        elif valuetype in [ExpressionValueType.STRING, ExpressionValueType.GUID, ExpressionValueType.DATETIME]:
+        elif valuetype in _UNCONVERTED_VALUETYPES:
             self._value = value
         else:
             raise TypeError(f"cannot create new value expression; unexpected expression value type: {normalize_enumname(valuetype)}")
@@ -113,7 +116,7 @@ class ValueExpression(Expression):
 
     def _validate_valuetype(self, valuetype: ExpressionValueType) -> Optional[Exception]:
         if valuetype != self._valuetype:
-            return TypeError(f"cannot read expression value expression as \"{normalize_enumname(valuetype)}\", type is \"{normalize_enumname(self._valuetype)}\"")
+            return TypeError(f"cannot read expression value expression as \"{EXPRESSIONVALUETYPE_NAMES[valuetype]}\", type is \"{EXPRESSIONVALUETYPE_NAMES[self._valuetype]}\"")
 
         return None
 
@@ -273,9 +276,9 @@ class ValueExpression(Expression):
             if target_typevalue == ExpressionValueType.STRING:
                 return ValueExpression(target_typevalue, str(value)), None
         except Exception as ex:
-            return None, ValueError(f"failed while attempting to convert from \"{from_typename}\" value ({value}) to \"{normalize_enumname(target_typevalue.name)}\": {ex}")
+            return None, ValueError(f"failed while attempting to convert from \"{from_typename}\" value ({value}) to \"{EXPRESSIONVALUETYPE_NAMES[target_typevalue]}\": {ex}")
 
-        return None, TypeError(f"cannot convert \"{from_typename}\" value ({value}) to \"{normalize_enumname(target_typevalue)}\"")
+        return None, TypeError(f"cannot convert \"{from_typename}\" value ({value}) to \"{EXPRESSIONVALUETYPE_NAMES[target_typevalue]}\"")
 
     def _convert_fromboolean(self, target_typevalue: ExpressionValueType) -> Tuple[Optional["ValueExpression"], Optional[Exception]]:
         return self._convert_fromnumeric(self._booleanvalue_asint(), "Boolean", target_typevalue)
@@ -320,9 +323,9 @@ class ValueExpression(Expression):
             if target_typevalue == ExpressionValueType.DATETIME:
                 return ValueExpression(target_typevalue, Convert.from_str(value, datetime)), None
         except Exception as ex:
-            return None, ValueError(f"failed while attempting to convert \"String\" value ('{value}') to \"{normalize_enumname(target_typevalue)}\": {ex}")
+            return None, ValueError(f"failed while attempting to convert \"String\" value ('{value}') to \"{EXPRESSIONVALUETYPE_NAMES[target_typevalue]}\": {ex}")
 
-        return None, TypeError(f"cannot convert \"String\" value ('{value}') to \"{normalize_enumname(target_typevalue)}\"")
+        return None, TypeError(f"cannot convert \"String\" value ('{value}') to \"{EXPRESSIONVALUETYPE_NAMES[target_typevalue]}\"")
 
     def _convert_fromguid(self, target_typevalue: ExpressionValueType) -> Tuple[Optional["ValueExpression"], Optional[Exception]]:
         value = self._guidvalue()
@@ -333,7 +336,7 @@ class ValueExpression(Expression):
         if target_typevalue == ExpressionValueType.GUID:
             return ValueExpression(target_typevalue, value), None
 
-        return None, TypeError(f"cannot convert \"Guid\" to \"{normalize_enumname(target_typevalue)}\"")
+        return None, TypeError(f"cannot convert \"Guid\" to \"{EXPRESSIONVALUETYPE_NAMES[target_typevalue]}\"")
 
     def _convert_fromdatetime(self, target_typevalue: ExpressionValueType) -> Tuple[Optional["ValueExpression"], Optional[Exception]]:
         value = self._datetimevalue()
@@ -0,0 +1,26 @@
+# ******************************************************************************************************
+#  __init__.py - Gbtc
+#
+#  Copyright © 2022, Grid Protection Alliance.  All Rights Reserved.
+#
+#  Licensed to the Grid Protection Alliance (GPA) under one or more contributor license agreements. See
+#  the NOTICE file distributed with this work for additional information regarding copyright ownership.
+#  The GPA licenses this file to you under the MIT License (MIT), the "License"; you may not use this
+#  file except in compliance with the License. You may obtain a copy of the License at:
+#
+#      http://opensource.org/licenses/MIT
+#
+#  Unless agreed to in writing, the subject software distributed under the License is distributed on an
+#  "AS-IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. Refer to the
+#  License for the specific language governing permissions and limitations.
+#
+#  Code Modification History:
+#  ----------------------------------------------------------------------------------------------------
+#  10/17/2026 - agent
+#       Generated original version of source code.
+#
+# ******************************************************************************************************
+
+import os  # nopep8
+import sys  # nopep8
+sys.path.append(f"{os.path.dirname(os.path.realpath(__file__))}/../../src")  # nopep8
@@ -0,0 +1,74 @@
+# ******************************************************************************************************
+#  test_streamencoder.py - Gbtc
+#
+#  Copyright © 2022, Grid Protection Alliance.  All Rights Reserved.
+#
+#  Licensed to the Grid Protection Alliance (GPA) under one or more contributor license agreements. See
+#  the NOTICE file distributed with this work for additional information regarding copyright ownership.
+#  The GPA licenses this file to you under the MIT License (MIT), the "License"; you may not use this
+#  file except in compliance with the License. You may obtain a copy of the License at:
+#
+#      http://opensource.org/licenses/MIT
+#
+#  Unless agreed to in writing, the subject software distributed under the License is distributed on an
+#  "AS-IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. Refer to the
+#  License for the specific language governing permissions and limitations.
+#
+#  Code Modification History:
+#  ----------------------------------------------------------------------------------------------------
+#  10/17/2026 - agent
+#       Generated original version of source code.
+#
+# ******************************************************************************************************
+
+import unittest
+from src.gsf.streamencoder import StreamEncoder
+from typing import Callable
+
+
+class TestStreamEncoder(unittest.TestCase):
+
+    @staticmethod
+    def _create_reader(source: bytes, maxlength: int, overread: int = 0) -> Callable[[int], bytes]:
+        position = 0
+
+        def read(length: int) -> bytes:
+            nonlocal position
+            length = min(length, maxlength) + overread
+            buffer = source[position:position + length]
+            position += len(buffer)
+            return buffer
+
+        return read
+
+    def test_read_exact_partial_reads(self):
+        source = bytes(range(100))
+        encoder = StreamEncoder(TestStreamEncoder._create_reader(source, 3), None)
+
+        self.assertEqual(bytes(encoder.read_exact(10)), source[:10])
+
+        # Larger than the initial receive buffer, which is then grown
+        self.assertEqual(bytes(encoder.read_exact(90)), source[10:])
+
+    def test_read_exact_short_read(self):
+        encoder = StreamEncoder(TestStreamEncoder._create_reader(bytes(range(5)), 2), None)
+
+        with self.assertRaises(RuntimeError):
+            encoder.read_exact(8)
+
+    def test_read_exact_overlong_read(self):
+        encoder = StreamEncoder(TestStreamEncoder._create_reader(bytes(range(20)), 6, 3), None)
+
+        # Reader returns more bytes than requested, extra bytes cannot be kept without losing stream position
+        with self.assertRaises(RuntimeError):
+            encoder.read_uint16("big")
+
+    def test_read_int(self):
+        encoder = StreamEncoder(TestStreamEncoder._create_reader(bytes([1, 0, 0, 0, 0, 0, 0, 2]), 1), None)
+
+        self.assertEqual(encoder.read_uint32("little"), 1)
+        self.assertEqual(encoder.read_uint32("big"), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# ******************************************************************************************************
+#  test_constants.py - Gbtc
+#
+#  Copyright © 2022, Grid Protection Alliance.  All Rights Reserved.
+#
+#  Licensed to the Grid Protection Alliance (GPA) under one or more contributor license agreements. See
+#  the NOTICE file distributed with this work for additional information regarding copyright ownership.
+#  The GPA licenses this file to you under the MIT License (MIT), the "License"; you may not use this
+#  file except in compliance with the License. You may obtain a copy of the License at:
+#
+#      http://opensource.org/licenses/MIT
+#
+#  Unless agreed to in writing, the subject software distributed under the License is distributed on an
+#  "AS-IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. Refer to the
+#  License for the specific language governing permissions and limitations.
+#
+#  Code Modification History:
+#  ----------------------------------------------------------------------------------------------------
+#  10/17/2026 - agent
+#       Generated original version of source code.
+#
+# ******************************************************************************************************
+
+import unittest
+import pickle
+from src.sttp.data.constants import ExpressionOperatorType, ExpressionValueType, TimeInterval, derive_operationvaluetype
+from src.sttp.data.errors import EvaluateError
+
+
+class TestConstants(unittest.TestCase):
+
+    def test_operationerror_pickle(self):
+        _, err = derive_operationvaluetype(ExpressionOperatorType.ADD, ExpressionValueType.GUID, ExpressionValueType.INT32)
+
+        self.assertIsInstance(err, EvaluateError)
+        self.assertEqual(str(err), "cannot perform \"+\" operation on \"Guid\" and \"Int32\"")
+        self.assertEqual(err.args, (ExpressionOperatorType.ADD, ExpressionValueType.GUID, ExpressionValueType.INT32))
+
+        unpickled = pickle.loads(pickle.dumps(err))
+
+        self.assertIsInstance(unpickled, EvaluateError)
+        self.assertEqual(str(unpickled), str(err))
+        self.assertEqual(unpickled.args, err.args)
+
+    def test_timeinterval_parse(self):
+        for interval in TimeInterval:
+            name = interval.name
+
+            for casedname in (name, name.lower(), name.capitalize(), name[0].lower() + name[1:]):
+                self.assertIs(TimeInterval.parse(casedname), interval,
+                              f"test_timeinterval_parse: failed to parse \"{casedname}\"")
+
+        self.assertIs(TimeInterval.parse("dAyOfYeAr"), TimeInterval.DAYOFYEAR)
+        self.assertIsNone(TimeInterval.parse("Fortnight"))
+        self.assertIsNone(TimeInterval.parse(""))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# ******************************************************************************************************
+#  test_datarow.py - Gbtc
+#
+#  Copyright © 2022, Grid Protection Alliance.  All Rights Reserved.
+#
+#  Licensed to the Grid Protection Alliance (GPA) under one or more contributor license agreements. See
+#  the NOTICE file distributed with this work for additional information regarding copyright ownership.
+#  The GPA licenses this file to you under the MIT License (MIT), the "License"; you may not use this
+#  file except in compliance with the License. You may obtain a copy of the License at:
+#
+#      http://opensource.org/licenses/MIT
+#
+#  Unless agreed to in writing, the subject software distributed under the License is distributed on an
+#  "AS-IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. Refer to the
+#  License for the specific language governing permissions and limitations.
+#
+#  Code Modification History:
+#  ----------------------------------------------------------------------------------------------------
+#  10/17/2026 - agent
+#       Generated original version of source code.
+#
+# ******************************************************************************************************
+
+import unittest
+from src.sttp.data.dataset import DataSet
+from src.sttp.data.datatable import DataTable
+from src.sttp.data.datatype import DataType
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+class TestDataRow(unittest.TestCase):
+
+    @staticmethod
+    def _create_datatable() -> DataTable:
+        dataset = DataSet()
+        datatable = dataset.create_table("Measurements")
+
+        datatable.add_column(datatable.create_column("ID", DataType.INT32))
+        datatable.add_column(datatable.create_column("Name", DataType.STRING))
+        datatable.add_column(datatable.create_column("DoubleID", DataType.INT32, "ID * 2"))
+
+        for i in range(200):
+            datarow = datatable.create_row()
+            datarow.set_value(0, i)
+            datarow.set_value(1, f"Name{i}")
+            datatable.add_row(datarow)
+
+        dataset.add_table(datatable)
+
+        return datatable
+
+    def test_computedvalue_concurrent_evaluation(self):
+        datatable = TestDataRow._create_datatable()
+
+        def read_computedvalues(_) -> bool:
+            for i in range(datatable.rowcount):
+                value, err = datatable.row(i).value(2)
+
+                if err is not None or value != i * 2:
+                    return False
+
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(read_computedvalues, range(16)))
+
+        self.assertTrue(all(results),
+                        "test_computedvalue_concurrent_evaluation: computed values did not match source rows")
+
+    def test_value_byname_computed(self):
+        datatable = TestDataRow._create_datatable()
+        datarow = datatable.row(21)
+
+        value, err = datarow.value_byname("doubleid")
+
+        self.assertIsNone(err)
+        self.assertEqual(value, 42)
+
+        value, err = datarow.value_byname("Missing")
+
+        self.assertIsNone(value)
+        self.assertIsInstance(err, ValueError)
+
+    def test_datetime_value_as_string(self):
+        dataset = DataSet()
+        datatable = dataset.create_table("Events")
+
+        datatable.add_column(datatable.create_column("Text", DataType.STRING))
+        datatable.add_column(datatable.create_column("Timestamp", DataType.DATETIME))
+        datatable.add_column(datatable.create_column("Parsed", DataType.DATETIME, "Text"))
+
+        datarow = datatable.create_row()
+        datarow.set_value(0, "2022-09-01 12:34:56.78")
+        datarow.set_value(1, datetime(2021, 1, 2, 3, 4, 5, 600000))
+        datatable.add_row(datarow)
+        dataset.add_table(datatable)
+
+        self.assertEqual(datarow.value_as_string(1), "2021-01-02T03:04:05.60")
+        self.assertEqual(datarow.value_as_string_byname("Timestamp"), "2021-01-02T03:04:05.60")
+
+        # Computed DateTime column converted from a String column value
+        value, err = datarow.value(2)
+
+        self.assertIsNone(err)
+        self.assertEqual(value, datetime(2022, 9, 1, 12, 34, 56, 780000))
+        self.assertEqual(datarow.value_as_string(2), "2022-09-01T12:34:56.78")
+
+        self.assertEqual(repr(datarow), "[\"2022-09-01 12:34:56.78\", 2021-01-02T03:04:05.60, 2022-09-01T12:34:56.78]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+# ******************************************************************************************************
+#  test_datatable.py - Gbtc
+#
+#  Copyright © 2022, Grid Protection Alliance.  All Rights Reserved.
+#
+#  Licensed to the Grid Protection Alliance (GPA) under one or more contributor license agreements. See
+#  the NOTICE file distributed with this work for additional information regarding copyright ownership.
+#  The GPA licenses this file to you under the MIT License (MIT), the "License"; you may not use this
+#  file except in compliance with the License. You may obtain a copy of the License at:
+#
+#      http://opensource.org/licenses/MIT
+#
+#  Unless agreed to in writing, the subject software distributed under the License is distributed on an
+#  "AS-IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. Refer to the
+#  License for the specific language governing permissions and limitations.
+#
+#  Code Modification History:
+#  ----------------------------------------------------------------------------------------------------
+#  10/17/2026 - agent
+#       Generated original version of source code.
+#
+# ******************************************************************************************************
+
+import unittest
+import numpy as np
+from src.sttp.data.dataset import DataSet
+from src.sttp.data.datatable import DataTable
+from src.sttp.data.datarow import DataRow
+from src.sttp.data.datatype import DataType
+from decimal import Decimal
+from functools import cmp_to_key
+
+
+class TestDataTable(unittest.TestCase):
+
+    @staticmethod
+    def _create_datatable() -> DataTable:
+        dataset = DataSet()
+        datatable = dataset.create_table("Measurements")
+
+        datatable.add_column(datatable.create_column("ID", DataType.INT32))
+        datatable.add_column(datatable.create_column("Enabled", DataType.BOOLEAN))
+        datatable.add_column(datatable.create_column("Value", DataType.DOUBLE))
+        datatable.add_column(datatable.create_column("Name", DataType.STRING))
+        datatable.add_column(datatable.create_column("Amount", DataType.DECIMAL))
+        datatable.add_column(datatable.create_column("DoubleID", DataType.INT64, "ID * 2"))
+
+        for id, enabled, value, name, amount in (
+                (3, True, 1.5, "b", Decimal("2.5")),
+                (1, None, None, None, None),
+                (2, False, -2.0, "A", Decimal(1))):
+            datarow = datatable.create_row()
+            datarow.set_value(0, id)
+
+            for columnindex, columnvalue in ((1, enabled), (2, value), (3, name), (4, amount)):
+                if columnvalue is not None:
+                    datarow.set_value(columnindex, columnvalue)
+
+            datatable.add_row(datarow)
+
+        dataset.add_table(datatable)
+
+        return datatable
+
+    def test_column_and_row_range(self):
+        datatable = TestDataTable._create_datatable()
+
+        self.assertIsNotNone(datatable.column(datatable.columncount - 1))
+        self.assertIsNone(datatable.column(datatable.columncount))
+        self.assertIsNone(datatable.column(-1))
+
+        self.assertIsNotNone(datatable.row(datatable.rowcount - 1))
+        self.assertIsNone(datatable.row(datatable.rowcount))
+        self.assertIsNone(datatable.row(-1))
+
+    def test_column_values(self):
+        datatable = TestDataTable._create_datatable()
+
+        values, nulls, err = datatable.column_values(0)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, np.int32)
+        self.assertEqual(values.tolist(), [3, 1, 2])
+        self.assertEqual(nulls.tolist(), [False, False, False])
+
+        values, nulls, err = datatable.column_values(1)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, np.bool_)
+        self.assertEqual(values.tolist(), [True, False, False])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+        values, nulls, err = datatable.column_values(2)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, np.float64)
+        self.assertEqual(values.tolist(), [1.5, 0.0, -2.0])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+        values, nulls, err = datatable.column_values(3)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, object)
+        self.assertEqual(values.tolist(), ["b", "", "A"])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+        values, nulls, err = datatable.column_values(4)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, object)
+        self.assertEqual(values.tolist(), [Decimal("2.5"), Decimal(0), Decimal(1)])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+    def test_column_values_computed(self):
+        datatable = TestDataTable._create_datatable()
+
+        values, nulls, err = datatable.column_values(5)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual(values.tolist(), [6, 2, 4])
+        self.assertEqual(nulls.tolist(), [False, False, False])
+
+    def test_column_values_empty_table(self):
+        datatable = TestDataTable._create_datatable()
+        datatable.clear_rows()
+
+        values, nulls, err = datatable.column_values(0)
+
+        self.assertIsNone(err)
+        self.assertEqual(values.dtype, np.int32)
+        self.assertEqual(len(values), 0)
+        self.assertEqual(len(nulls), 0)
+
+    def test_column_values_invalid_index(self):
+        datatable = TestDataTable._create_datatable()
+
+        values, nulls, err = datatable.column_values(datatable.columncount)
+
+        self.assertIsNone(values)
+        self.assertIsNone(nulls)
+        self.assertIsInstance(err, IndexError)
+
+    def test_column_values_out_of_range(self):
+        dataset = DataSet()
+        datatable = dataset.create_table("Values")
+        datatable.add_column(datatable.create_column("Small", DataType.INT8))
+
+        datarow = datatable.create_row()
+        datarow.set_value(0, 300)
+        datatable.add_row(datarow)
+
+        values, nulls, err = datatable.column_values(0)
+
+        self.assertIsNone(values)
+        self.assertIsNone(nulls)
+        self.assertIsInstance(err, ValueError)
+        self.assertIn("row 0", str(err))
+        self.assertIn("\"Small\"", str(err))
+
+        order, err = datatable.argsort_column(0)
+
+        self.assertIsNone(order)
+        self.assertIsInstance(err, ValueError)
+
+    def test_argsort_column(self):
+        datatable = TestDataTable._create_datatable()
+
+        for id, enabled, value, name in ((4, True, 1.5, "a"), (5, None, 0.5, "B"), (6, False, None, "b"), (7, True, -2.0, None)):
+            datarow = datatable.create_row()
+            datarow.set_value(0, id)
+
+            for columnindex, columnvalue in ((1, enabled), (2, value), (3, name)):
+                if columnvalue is not None:
+                    datarow.set_value(columnindex, columnvalue)
+
+            datatable.add_row(datarow)
+
+        rows = [datatable.row(i) for i in range(datatable.rowcount)]
+
+        for columnindex in range(datatable.columncount):
+            for exactmatch in (False, True):
+                def compare_rows(leftindex: int, rightindex: int) -> int:
+                    result, err = DataRow.compare_datarowcolumns(rows[leftindex], rows[rightindex], columnindex, exactmatch)
+                    self.assertIsNone(err)
+                    return result
+
+                expected = sorted(range(len(rows)), key=cmp_to_key(compare_rows))
+                order, err = datatable.argsort_column(columnindex, exactmatch)
+
+                self.assertIsNone(err)
+                self.assertEqual(order.tolist(), expected,
+                                 f"test_argsort_column: order mismatch for column {columnindex}, exactmatch={exactmatch}")
+
+    def test_select_orderby(self):
+        dataset = DataSet()
+        datatable = dataset.create_table("Devices")
+
+        datatable.add_column(datatable.create_column("ID", DataType.INT32))
+        datatable.add_column(datatable.create_column("Enabled", DataType.BOOLEAN))
+        datatable.add_column(datatable.create_column("Name", DataType.STRING))
+        datatable.add_column(datatable.create_column("Value", DataType.DOUBLE))
+
+        for id, enabled, name, value in (
+                (1, True, "b", 1.0),
+                (2, False, "a", None),
+                (3, None, "B", 1.0),
+                (4, True, "a", 2.0),
+                (5, False, None, 1.0),
+                (6, True, "b", None)):
+            datarow = datatable.create_row()
+            datarow.set_value(0, id)
+
+            for columnindex, columnvalue in ((1, enabled), (2, name), (3, value)):
+                if columnvalue is not None:
+                    datarow.set_value(columnindex, columnvalue)
+
+            datatable.add_row(datarow)
+
+        dataset.add_table(datatable)
+
+        # Nulls sort first ascending and last descending, True sorts before False, ties keep table order
+        for sortorder, expected in (
+                ("Name", [5, 3, 2, 4, 1, 6]),
+                ("Enabled, ID DESC", [3, 6, 4, 1, 5, 2]),
+                ("Value DESC, Name", [4, 5, 3, 1, 2, 6]),
+                ("BINARY Name DESC, Enabled DESC", [1, 6, 3, 2, 4, 5]),
+                ("Enabled DESC, Value", [2, 5, 6, 1, 4, 3])):
+            rows, err = datatable.select("True", sortorder)
+
+            self.assertIsNone(err)
+            self.assertEqual([row.value(0)[0] for row in rows], expected,
+                             f"test_select_orderby: unexpected order for \"{sortorder}\"")
+
+
+if __name__ == '__main__':
+    unittest.main()